@@ -424,6 +424,42 @@ class SupabaseUserProfile:
             if conn:
                 conn.close()
 
+    @classmethod
+    def update_processing_status(cls, user_id: str, status: str) -> bool:
+        """
+        Set processing_status with a single-column UPDATE.
+
+        Cheaper than get() + save() for transient status changes: no read,
+        and no rewrite of the full row (resume text, persona, questions).
+        Returns True if a profile row was updated.
+        """
+        adapter = get_adapter()
+        conn = None
+        cursor = None
+        try:
+            conn = adapter.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                UPDATE user_profiles
+                SET processing_status = %s, updated_at = %s
+                WHERE user_id = %s
+            """, (status, datetime.now(timezone.utc), user_id))
+            conn.commit()
+
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            logger.error(f"Error updating processing status for user {user_id}: {e}")
+            if conn:
+                conn.rollback()
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+
     def _get_real_user_name(self) -> Optional[str]:
         """Fetch the real user name (first_name + last_name) from the users table."""
         try:
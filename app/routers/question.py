@@ -3,7 +3,9 @@ Question modification routes.
 """
 import logging
 from functools import lru_cache
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional, Tuple
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from app.schemas.question import QuestionPayload, QuestionResponse, PreviousUserResponse
 from app.services.question_service import QuestionService
 
@@ -18,9 +20,46 @@ def get_question_service() -> QuestionService:
     return QuestionService()
 
 
+def _resolve_conversation(
+    payload: QuestionPayload,
+    question_service: QuestionService,
+    background_tasks: BackgroundTasks
+) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Work out (is_first_call, user_message, context) from previous responses."""
+    # Check if this is the first call
+    # First call: previous_user_response array is empty OR the last item's user_response is empty/null
+    is_first_call = True
+    user_message = None
+    context = None
+
+    if payload.previous_user_response and len(payload.previous_user_response) > 0:
+        # Get the last response
+        last_response = payload.previous_user_response[-1]
+        user_message = last_response.user_response if last_response.user_response else None
+
+        # If user_response has a value, it's not the first call
+        if user_message and user_message.strip():
+            is_first_call = False
+            # Build context from previous responses (excluding empty ones):
+            # recent turns verbatim, older turns as a cached summary
+            previous = payload.previous_user_response
+            summary = question_service.cached_history_summary(previous)
+            if summary is None:
+                # Summarize after the response is sent so this request makes a
+                # single LLM round trip; the next turn reads it from the cache.
+                # Until then the whole history goes in verbatim.
+                background_tasks.add_task(question_service.summarize_history_async, previous)
+                context = question_service.build_conversation_context(previous, window=len(previous))
+            else:
+                context = question_service.build_conversation_context(previous, summary=summary)
+
+    return is_first_call, user_message, context
+
+
 @router.post("/modify-question", response_model=QuestionResponse)
 async def modify_question(
     payload: QuestionPayload,
+    background_tasks: BackgroundTasks,
     question_service: QuestionService = Depends(get_question_service)
 ):
     """
@@ -31,30 +70,17 @@ async def modify_question(
     subsequent calls (with conversation context).
     """
     try:
-        # Check if this is the first call
-        # First call: previous_user_response array is empty OR the last item's user_response is empty/null
-        is_first_call = True
-        user_message = None
-        context = None
-
-        if payload.previous_user_response and len(payload.previous_user_response) > 0:
-            # Get the last response
-            last_response = payload.previous_user_response[-1]
-            user_message = last_response.user_response if last_response.user_response else None
-
-            # If user_response has a value, it's not the first call
-            if user_message and user_message.strip():
-                is_first_call = False
-                # Build context from all previous responses (excluding empty ones)
-                context = question_service.build_conversation_context(payload.previous_user_response)
+        is_first_call, user_message, context = _resolve_conversation(
+            payload, question_service, background_tasks
+        )
 
         if is_first_call:
             # First time: just modify the prompt with friendly tone, including options if available
-            modified_text = question_service.modify_question_tone(payload.prompt, options=payload.options)
+            modified_text = await question_service.modify_question_tone_async(payload.prompt, options=payload.options)
         else:
             # Subsequent call: use user message and conversation context, including options if available
             # Use the user message and current prompt to create natural conversation flow
-            modified_text = question_service.modify_question_tone(
+            modified_text = await question_service.modify_question_tone_async(
                 payload.prompt,
                 user_message=user_message,
                 context=context,
@@ -63,7 +89,7 @@ async def modify_question(
 
         # Generate a follow-up question for suggestion_chips based on the modified ai_text
         try:
-            suggestion_chips = question_service.generate_followup_question(modified_text, payload.prompt)
+            suggestion_chips = await question_service.generate_followup_question_async(modified_text, payload.prompt)
         except Exception as e:
             logger.warning(f"Failed to generate follow-up question: {str(e)}, using original suggestion_chips")
             # If generation fails, fallback to original suggestion_chips from payload
@@ -81,3 +107,39 @@ async def modify_question(
         logger.error(f"Error modifying question: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+
+
+@router.post("/modify-question/stream")
+async def modify_question_stream(
+    payload: QuestionPayload,
+    background_tasks: BackgroundTasks,
+    question_service: QuestionService = Depends(get_question_service)
+):
+    """
+    Stream the modified question text as it is generated.
+
+    Same inputs as /modify-question, but returns text/plain chunks so the
+    frontend can render progressively. Suggestion chips are not generated
+    here; callers fall back to the payload's suggestion_chips.
+    """
+    try:
+        is_first_call, user_message, context = _resolve_conversation(
+            payload, question_service, background_tasks
+        )
+        if is_first_call:
+            user_message, context = None, None
+
+        return StreamingResponse(
+            question_service.modify_question_tone_stream(
+                payload.prompt,
+                user_message=user_message,
+                context=context,
+                options=payload.options
+            ),
+            media_type="text/plain; charset=utf-8"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming modified question: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
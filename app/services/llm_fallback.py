@@ -51,6 +51,11 @@ FALLBACK_CONFIG = {
     "matching": {"provider": "gemini", "model": "gemini-3.1-pro-preview"},
 }
 
+# OpenAI model families that reject `max_tokens` and require
+# `max_completion_tokens`. Resolved up front from the model name so a request
+# is never sent twice just to discover the right parameter.
+MAX_COMPLETION_TOKENS_MODELS = ("o1", "o3", "o4", "gpt-5", "gpt-4.1", "gpt-4o-realtime")
+
 # ─── API Key Mapping ─────────────────────────────────────────────────────────
 
 ANTHROPIC_KEY_MAP = {
@@ -86,6 +91,13 @@ def create_anthropic_client(service: str):
     return Anthropic(api_key=key)
 
 
+def _openai_token_param(model: str) -> str:
+    """Name of the output-token limit parameter the OpenAI model accepts."""
+    if model.startswith(MAX_COMPLETION_TOKENS_MODELS):
+        return "max_completion_tokens"
+    return "max_tokens"
+
+
 def _get_openai_client():
     """Lazy-load OpenAI client."""
     global _openai_client
@@ -154,8 +166,8 @@ def _call_openai_full(
     response = client.chat.completions.create(
         model=model,
         messages=openai_messages,
-        max_tokens=max_tokens,
         temperature=temperature,
+        **{_openai_token_param(model): max_tokens},
     )
     return response.choices[0].message.content
 
@@ -149,20 +149,43 @@ class EngagementMetrics:
         if self.questions_answered == 0 and self.questions_skipped == 0:
             return UserEngagementLevel.MODERATE
 
-        # High engagement: detailed responses, few skips
-        if self.avg_response_length > 100 and self.questions_skipped == 0:
-            return UserEngagementLevel.HIGH
-
-        # Frustrated: many skips, very short responses
-        skip_rate = (self.questions_skipped /
-                    max(1, self.questions_answered + self.questions_skipped))
-        if skip_rate > 0.3 or self.avg_response_length < 10:
-            if self.avg_response_time_seconds < 5:
-                return UserEngagementLevel.FRUSTRATED
-            return UserEngagementLevel.LOW
-
-        # Moderate is the default
-        return UserEngagementLevel.MODERATE
+        # Quantize metrics into small integer buckets and index the
+        # precomputed table instead of chaining float comparisons.
+        # length: 0 = <10 chars, 1 = 10-100, 2 = >100
+        length = self.avg_response_length
+        lb = 0 if length < 10 else (2 if length > 100 else 1)
+        # skips: 0 = none, 1 = skip rate <= 30%, 2 = skip rate > 30%
+        # (integer form of skipped / total > 0.3, no division needed)
+        skipped = self.questions_skipped
+        if skipped == 0:
+            sb = 0
+        else:
+            sb = 2 if skipped * 10 > 3 * (self.questions_answered + skipped) else 1
+        # time: 0 = <5s (rushing), 1 = >=5s
+        tb = 0 if self.avg_response_time_seconds < 5 else 1
+
+        return _ENGAGEMENT_LEVEL_TABLE[lb][sb][tb]
+
+
+# Engagement lookup indexed by (length_bucket, skip_bucket, time_bucket).
+# Encodes the original rules:
+#   HIGH       - detailed responses (>100 chars) and no skips
+#   FRUSTRATED - skip rate > 30% or very short responses, answered quickly
+#   LOW        - skip rate > 30% or very short responses, answered slowly
+#   MODERATE   - everything else
+_F = UserEngagementLevel.FRUSTRATED
+_L = UserEngagementLevel.LOW
+_M = UserEngagementLevel.MODERATE
+_H = UserEngagementLevel.HIGH
+_ENGAGEMENT_LEVEL_TABLE: Tuple[Tuple[Tuple[UserEngagementLevel, ...], ...], ...] = (
+    # lb=0 (<10 chars): always short
+    ((_F, _L), (_F, _L), (_F, _L)),
+    # lb=1 (10-100 chars)
+    ((_M, _M), (_M, _M), (_F, _L)),
+    # lb=2 (>100 chars)
+    ((_H, _H), (_M, _M), (_F, _L)),
+)
+del _F, _L, _M, _H
 
 
 class ProgressiveDisclosure:
@@ -528,6 +551,12 @@ class ProgressiveDisclosure:
         # Engagement tracking per session
         self._engagement_metrics: Dict[str, EngagementMetrics] = {}
 
+        # Transition batch ids depend only on the phase; the batch itself is
+        # built fresh per call so no state is shared between sessions
+        self._transition_batch_ids: Dict[ConversationPhase, str] = {
+            phase: f"transition_{phase.value}" for phase in ConversationPhase
+        }
+
         # P3 FIX: Slot to topic mapping for semantic coverage tracking
         self._slot_to_topic = {
             "primary_goal": "goals",
@@ -1009,7 +1038,7 @@ class ProgressiveDisclosure:
         """Create a batch indicating phase transition."""
         # This signals the UI to show a transition message
         return DisclosureBatch(
-            batch_id=f"transition_{context.phase.value}",
+            batch_id=self._transition_batch_ids[context.phase],
             questions=[],
             phase=context.phase,
             progress_percent=self._calculate_progress(context),
@@ -4,29 +4,471 @@ Uses Claude Sonnet 4.5 for warm, engaging question modifications.
 """
 import os
 import re
+import json
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Union, Any
-from anthropic import Anthropic
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+from typing import List, Dict, Optional, Union, Any, Tuple, AsyncIterator
+import httpx
+from cachetools import TTLCache
+from anthropic import Anthropic, AsyncAnthropic, RateLimitError, APIConnectionError
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type,
+    before_sleep_log
+)
 from dotenv import load_dotenv
 
+try:
+    # C-level JSON parsing for batched rewrite payloads
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+from app.services.llm_fallback import get_anthropic_key, ANTHROPIC_MODEL
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _ModelConfig:
+    """Immutable request settings, resolved once at import."""
+    name: str
+    max_tokens: int
+    temperature: float
+
+
+# Use Claude Sonnet 4.6 for warm, engaging conversations
+_CFG = _ModelConfig(
+    name=os.getenv('ANTHROPIC_CHAT_MODEL', ANTHROPIC_MODEL),
+    max_tokens=500,
+    temperature=0.7,
+)
+
+# Connection pools for the shared clients. The SDK default pool throttles once
+# many requests are in flight, so give concurrent callers enough headroom.
+ASYNC_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@lru_cache(maxsize=None)
+def _get_anthropic_client(api_key: str) -> Anthropic:
+    """
+    Process-wide sync client per API key.
+
+    Each client owns an httpx connection pool; sharing it means TLS handshakes
+    and DNS lookups are paid once and keep-alive connections get reused even
+    when QuestionService is constructed repeatedly. SDK retries are off
+    (max_retries=0): _retry_transient is the only retry layer.
+    """
+    return Anthropic(
+        api_key=api_key,
+        http_client=httpx.Client(limits=HTTP_LIMITS, timeout=60.0),
+        max_retries=0,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_async_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Process-wide async client per API key (see _get_anthropic_client)."""
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(limits=ASYNC_HTTP_LIMITS, timeout=60.0),
+        max_retries=0,
+    )
+
+
+# Upper bound on in-flight async LLM calls per worker. Unbounded gathers
+# (e.g. batch fallbacks) otherwise pile hundreds of requests onto one httpx
+# pool, where throughput degrades and provider rate limits kick in.
+QUESTION_MAX_CONCURRENCY = int(os.getenv('QUESTION_MAX_CONCURRENCY', '32'))
+_LLM_SEMAPHORE = asyncio.Semaphore(QUESTION_MAX_CONCURRENCY)
+
+# Backoff for transient provider errors (rate limits, dropped connections);
+# other errors such as 400s fail immediately and go to the provider fallback.
+# The clients are built with max_retries=0, so this is the only retry layer.
+_retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+# Exact-match response cache. Users walking the same question flow produce
+# identical prompts (especially first-call rewrites), so repeat requests are
+# answered locally instead of paying a full LLM round trip.
+QUESTION_CACHE_MAX_SIZE = int(os.getenv('QUESTION_CACHE_MAX_SIZE', '10000'))
+QUESTION_CACHE_TTL_SECONDS = int(os.getenv('QUESTION_CACHE_TTL_SECONDS', '3600'))
+
+
+# =============================================================================
+# STATIC PROMPTS
+# =============================================================================
+# Built once at import. Everything request-specific (context, user message,
+# question, options) goes at the END of the user message, after the fixed
+# scaffolding.
+
+SYSTEM_PROMPT_FULL = """You are a friendly, genuine person having a soft, frank conversation.
+You'll acknowledge what the user just said in a warm, human way, then naturally ask the next question.
+Use a soft, frank tone - be honest, straightforward, and warm. Be justifiable and reasonable.
+Be genuinely friendly and curious - like talking to a friend. Use casual, everyday language.
+If options are provided, include them naturally in Markdown format (as a bulleted list or inline text).
+Return your response in Markdown format for better UI display."""
+
+# Same persona whether or not earlier turns are available.
+SYSTEM_PROMPT_USER_ONLY = SYSTEM_PROMPT_FULL
+
+SYSTEM_PROMPT_REWRITE = """You are a friendly, genuine person having a soft, frank conversation.
+Rewrite questions in a very friendly, casual, and human way - like you're genuinely curious and asking a friend.
+Use a soft, frank tone - be honest, straightforward, and warm. Be justifiable and reasonable in your approach.
+Use natural everyday language. Avoid formal or corporate tone.
+If options are provided, include them naturally in Markdown format (as a bulleted list or inline text).
+IMPORTANT: Return ONLY the modified question text. Do NOT add any introductory phrases, explanations, or meta-commentary.
+Start directly with the question as if you're naturally asking it."""
+
+SYSTEM_PROMPT_FOLLOWUP = """You are a friendly, genuine person creating follow-up questions with a soft, frank tone.
+Given a question that was just asked, create a related follow-up question that:
+1. Is a natural continuation or related to the original question
+2. Is concise and suitable for a suggestion chip/button
+3. Uses a soft, frank tone - honest, straightforward, and warm
+4. Is justifiable and reasonable - makes sense naturally
+5. Is friendly and conversational
+6. Helps guide the conversation forward
+
+Return only the follow-up question in plain text (no Markdown, no quotes, just the question)."""
+
+# Fixed user-message scaffolding, placed before the dynamic fields.
+ACKNOWLEDGE_INSTRUCTIONS = """Create a natural, friendly response with a soft, frank tone that:
+1. Briefly acknowledges what the user said in a warm, casual way (like a friend would)
+2. Smoothly transitions to asking the new question in a friendly, conversational tone
+3. Use a soft, frank approach - be honest and straightforward but warm
+4. Be justifiable and reasonable - explain naturally why you're asking if it makes sense
+5. If options are provided, include them naturally in Markdown format (preferably as a bulleted list)
+6. Sound genuinely curious and human - not robotic or formal
+
+Return the complete response in Markdown format."""
+
+# Batched rewrites return JSON, so this shares the tone of SYSTEM_PROMPT_REWRITE
+# without its "return only the question text" rule.
+SYSTEM_PROMPT_BATCH_REWRITE = """You are a friendly, genuine person having a soft, frank conversation.
+Rewrite questions in a very friendly, casual, and human way - like you're genuinely curious and asking a friend.
+Use a soft, frank tone - be honest, straightforward, and warm. Be justifiable and reasonable in your approach.
+Use natural everyday language. Avoid formal or corporate tone.
+If options are provided, include them naturally in Markdown format (as a bulleted list or inline text).
+Do NOT add introductory phrases, explanations, or meta-commentary to any question."""
+
+REWRITE_STYLE_GUIDELINES = """STYLE GUIDELINES:
+- Use a soft, frank tone - be honest, straightforward, and warm
+- Be justifiable and reasonable - explain why you're asking if it makes sense naturally
+- Be warm, friendly, and genuinely curious
+- Use casual, everyday language (like talking to a friend)
+- Sound natural and human - not robotic or formal
+- Be direct but gentle - frank but soft
+- If options are provided, include them naturally in Markdown format (preferably as a bulleted list) within the question"""
+
+REWRITE_INSTRUCTIONS = f"""Rewrite the question below in a very friendly, casual, and human way with a soft, frank tone.
+
+{REWRITE_STYLE_GUIDELINES}
+- Return ONLY the question text - no introductions, no explanations, just the friendly question itself"""
+
+BATCH_REWRITE_INSTRUCTIONS = f"""Rewrite each numbered question below in a very friendly, casual, and human way with a soft, frank tone.
+Apply these STYLE GUIDELINES to every question independently.
+
+{REWRITE_STYLE_GUIDELINES}
+
+Return ONLY a JSON object of the form {{"questions": ["...", "..."]}} containing one rewritten
+question per input, in the same order. No Markdown code fences, no commentary."""
+
+SUMMARY_SYSTEM_PROMPT = """You summarize onboarding conversations between an AI assistant and a user.
+Keep every concrete fact the user shared (goals, role, industry, stage, location, preferences, constraints).
+Be concise and neutral. Plain text only, no Markdown."""
+
+SUMMARY_INSTRUCTIONS = """Summarize the conversation below in at most 120 words, focusing on what the user told us."""
+
+# Answered turns kept verbatim in the context; older turns are summarized.
+# Bounds prompt size per question instead of growing with the whole history.
+CONTEXT_WINDOW_TURNS = int(os.getenv('QUESTION_CONTEXT_WINDOW', '6'))
+SUMMARY_MAX_TOKENS = 200
+
+# First-call questions with options and fewer estimated tokens than this are
+# formatted locally instead of sent to the LLM. Off by default (0) since the
+# local text skips the friendly rewording; set e.g. 10 to opt in.
+LOCAL_REWRITE_MAX_TOKENS = int(os.getenv('QUESTION_LOCAL_REWRITE_MAX_TOKENS', '0'))
+
+# Rough token count: words and punctuation marks. Close enough to a BPE
+# tokenizer for short English prompts, without loading one.
+_TOKEN_ESTIMATE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def _estimate_tokens(text: str) -> int:
+    """Approximate the LLM token count of a short text."""
+    return len(_TOKEN_ESTIMATE_RE.findall(text))
+
+
+# Wrapper around the formatted options in tone-rewrite prompts
+_OPTIONS_HDR = "\n\nAvailable options:\n"
+_OPTIONS_FTR = (
+    "\n\nPlease naturally incorporate these options into the question when modifying it. "
+    "Format the options nicely in Markdown."
+)
+
+# Characters buffered before the first streamed chunk is emitted, so intro
+# phrases and separator lines (all prefix-only) can still be stripped
+STREAM_CLEANUP_BUFFER_CHARS = 128
+
+# Overall output cap for a batched rewrite (each question gets the usual budget)
+BATCH_MAX_TOKENS = 4000
+
+FOLLOWUP_INSTRUCTIONS = """Create a concise, friendly follow-up question with a soft, frank tone that:
+- Relates to the question below and helps continue the conversation naturally
+- Uses a soft, frank approach - honest and straightforward but warm
+- Is justifiable and reasonable - makes sense in context
+- Is friendly and conversational
+
+Return only the question text, nothing else."""
+
+
+# Introductory phrases the LLM sometimes prepends to a rewritten question,
+# fused into one alternation so cleanup is a single regex pass.
+_INTRO_PHRASES_RE = re.compile(
+    r"^(?:sure!?\s*"
+    r"|here's?\s*"
+    r"|here is\s*"
+    r"|let me\s+"
+    r"|i'll\s+"
+    r"|i will\s+"
+    r"|of course!?\s*"
+    r"|absolutely!?\s*"
+    r"|certainly!?\s*"
+    r"|a friendlier (?:and more engaging )?version\s*"
+    r"|an engaging version\s*"
+    r"|a more engaging version\s*)+",
+    re.IGNORECASE,
+)
+# Leading blank lines, separator-only lines and lines opening with ---/===/___.
+# A plain lstrip("-=_") would also eat a Markdown bullet ("- Option"), so
+# match whole lines instead.
+_LEADING_SEPARATORS_RE = re.compile(
+    r"\A(?:[ \t\r]*(?:(?:---|===|___)[^\n]*|[-=_ \t\r]*)(?:\n|\Z))+"
+)
+# Remaining "Here's a friendlier version:" style lead-ins
+_INTRO_LEAD_IN_RE = re.compile(r"^(?:Here's?|Sure!?|Let me|I'll|I will)\s+[^:]*:\s*", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _format_option_labels(labels: Tuple[str, ...]) -> str:
+    """Format option labels as a Markdown bullet list (memoized)."""
+    return "\n".join([f"- {label}" for label in labels])
+
+
+# Tone-rewrite prompts by mode:
+#   full      - user replied and there is earlier conversation
+#   user_only - user replied, no earlier conversation
+#   rewrite   - first call, just rewrite the question
+SYSTEM_PROMPTS: Dict[str, str] = {
+    "full": SYSTEM_PROMPT_FULL,
+    "user_only": SYSTEM_PROMPT_USER_ONLY,
+    "rewrite": SYSTEM_PROMPT_REWRITE,
+}
+USER_TEMPLATES: Dict[str, Template] = {
+    "full": Template(ACKNOWLEDGE_INSTRUCTIONS + """
+
+Previous conversation:
+$context
+
+User's last response: "$user_message"
+
+New question to ask: $prompt$options_info"""),
+    "user_only": Template(ACKNOWLEDGE_INSTRUCTIONS + """
+
+User's response: "$user_message"
+
+New question to ask: $prompt$options_info"""),
+    "rewrite": Template(REWRITE_INSTRUCTIONS + """
+
+Question: $prompt$options_info"""),
+}
+
+
 class QuestionService:
     """Service for modifying questions with friendly, engaging tone."""
 
     def __init__(self):
         """Initialize question service with dedicated Anthropic API key (chat)."""
-        from app.services.llm_fallback import get_anthropic_key, ANTHROPIC_MODEL
         api_key = get_anthropic_key("chat")
         if not api_key:
             raise ValueError("ANTHROPIC_CHAT_KEY environment variable is required")
-        self.client = Anthropic(api_key=api_key)
-        # Use Claude Sonnet 4.6 for warm, engaging conversations
-        self.model = os.getenv('ANTHROPIC_CHAT_MODEL', ANTHROPIC_MODEL)
+        # Clients (and their connection pools) are shared across instances
+        self.client = _get_anthropic_client(api_key)
+        # Async client lets FastAPI handlers await calls (and gather several)
+        # without blocking the event loop on network I/O.
+        self.async_client = _get_async_anthropic_client(api_key)
+        self.model = _CFG.name
+
+        # Bounded in-process cache of final responses keyed by prompt hash
+        self._response_cache: TTLCache = TTLCache(
+            maxsize=QUESTION_CACHE_MAX_SIZE, ttl=QUESTION_CACHE_TTL_SECONDS
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._local_rewrites = 0
+        self._usage: Dict[str, Any] = {
+            "calls": 0,
+            "fallbacks": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "latency_ms": 0.0,
+        }
+
+    def _cache_key(self, kind: str, system_prompt: str, user_prompt: str) -> str:
+        """Hash the exact request (model + prompts) into a cache key."""
+        payload = json.dumps([kind, self.model, system_prompt, user_prompt], sort_keys=True)
+        return f"{kind}:{hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response, tracking hit/miss counters."""
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            logger.debug(f"Question cache hit (hits: {self._cache_hits}, misses: {self._cache_misses})")
+            return cached
+        self._cache_misses += 1
+        return None
     
+    @_retry_transient
+    def _create_message(self, system_prompt: str, messages: List[Dict[str, str]], max_tokens: int, temperature: float):
+        """Single Anthropic messages.create call, retried on rate limits/connection errors."""
+        return self.client.messages.create(
+            model=self.model, max_tokens=max_tokens, system=system_prompt, messages=messages, temperature=temperature
+        )
+
+    @_retry_transient
+    async def _create_message_async(self, system_prompt: str, messages: List[Dict[str, str]], max_tokens: int, temperature: float):
+        """Async counterpart of _create_message, gated by the concurrency semaphore."""
+        async with _LLM_SEMAPHORE:
+            return await self.async_client.messages.create(
+                model=self.model, max_tokens=max_tokens, system=system_prompt, messages=messages, temperature=temperature
+            )
+
+    def _record_usage(self, method: str, response: Any, started: float) -> None:
+        """
+        Log token usage and latency for one Anthropic call.
+
+        Emits one "[LLM Usage]" line per call and keeps running totals in
+        self._usage, so token use and retry/fallback frequency can be
+        compared before and after prompt changes.
+        """
+        latency_ms = (time.perf_counter() - started) * 1000
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        # Mocked or partial responses may carry non-numeric usage fields
+        if not all(isinstance(v, int) for v in (input_tokens, output_tokens)):
+            input_tokens = output_tokens = 0
+
+        totals = self._usage
+        totals["calls"] += 1
+        totals["input_tokens"] += input_tokens
+        totals["output_tokens"] += output_tokens
+        totals["latency_ms"] += latency_ms
+
+        logger.info(
+            f"[LLM Usage] service=question method={method} model={self.model} "
+            f"latency_ms={latency_ms:.0f} input={input_tokens} output={output_tokens}"
+        )
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """Running token/latency totals plus response-cache counters."""
+        stats = dict(self._usage)
+        stats["response_cache_hits"] = self._cache_hits
+        stats["response_cache_misses"] = self._cache_misses
+        stats["local_rewrites"] = self._local_rewrites
+        return stats
+
+    def _chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = _CFG.max_tokens,
+        temperature: float = _CFG.temperature,
+        fallback: bool = True
+    ) -> str:
+        """
+        Run one single-turn completion and return the stripped text.
+
+        All non-streaming calls go through here (or _chat_async) so retries,
+        provider fallback and instrumentation live in one place.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User message content
+            max_tokens: Output token budget
+            temperature: Sampling temperature
+            fallback: Retry on the fallback provider if Anthropic fails
+
+        Raises:
+            The Anthropic error if the call (and fallback, when enabled) fails
+        """
+        _msgs = [{"role": "user", "content": user_prompt}]
+        started = time.perf_counter()
+        try:
+            response = self._create_message(system_prompt, _msgs, max_tokens, temperature)
+            self._record_usage("chat", response, started)
+            return response.content[0].text.strip()
+        except Exception as api_err:
+            if not fallback:
+                raise
+            self._usage["fallbacks"] += 1
+            from app.services.llm_fallback import fallback_from_anthropic_error
+            result = fallback_from_anthropic_error(
+                service="chat", error=api_err, system_prompt=system_prompt, messages=_msgs,
+                max_tokens=max_tokens, temperature=temperature
+            )
+            if not result:
+                logger.error(f"Claude API error: {str(api_err)}")
+                raise api_err
+            return result.strip()
+
+    async def _chat_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = _CFG.max_tokens,
+        temperature: float = _CFG.temperature,
+        fallback: bool = True
+    ) -> str:
+        """Async counterpart of _chat (the sync fallback runs in a thread)."""
+        _msgs = [{"role": "user", "content": user_prompt}]
+        started = time.perf_counter()
+        try:
+            response = await self._create_message_async(system_prompt, _msgs, max_tokens, temperature)
+            self._record_usage("chat_async", response, started)
+            return response.content[0].text.strip()
+        except Exception as api_err:
+            if not fallback:
+                raise
+            self._usage["fallbacks"] += 1
+            from app.services.llm_fallback import fallback_from_anthropic_error
+            result = await asyncio.to_thread(
+                fallback_from_anthropic_error,
+                service="chat", error=api_err, system_prompt=system_prompt, messages=_msgs,
+                max_tokens=max_tokens, temperature=temperature
+            )
+            if not result:
+                logger.error(f"Claude API error: {str(api_err)}")
+                raise api_err
+            return result.strip()
+
     def format_options_for_prompt(self, options: Optional[Union[str, List[Any]]]) -> str:
         """Format options for prompt."""
         if not options:
@@ -36,24 +478,82 @@ class QuestionService:
         if isinstance(options, str):
             return options.strip()
         
-        # If options is a list, extract labels/values
+        # If options is a list, extract labels/values and reuse the memoized
+        # formatting - option lists come from a fixed schema and repeat a lot
         if isinstance(options, list):
-            option_labels = []
-            for item in options:
-                if isinstance(item, dict):
-                    # Handle dict format directly from JSON
-                    label = item.get('label', item.get('value', str(item)))
-                    option_labels.append(label)
-                else:
-                    # Fallback to string representation
-                    option_labels.append(str(item))
-            
-            if option_labels:
-                # Format as a nice list for the prompt
-                return "\n".join([f"- {label}" for label in option_labels])
+            labels = tuple(
+                # Handle dict format directly from JSON
+                str(item.get('label', item.get('value', str(item)))) if isinstance(item, dict)
+                # Fallback to string representation
+                else str(item)
+                for item in options
+            )
+            return _format_option_labels(labels)
         
         return ""
     
+    def _local_rewrite(
+        self,
+        prompt: str,
+        user_message: Optional[str],
+        context: Optional[str],
+        options: Optional[Union[str, List[Any]]]
+    ) -> Optional[str]:
+        """
+        Format trivial first-call questions locally instead of calling the LLM.
+
+        Very short prompts with options (e.g. "Industry?" + a list) have
+        nothing to rephrase - the LLM output is a few tokens around the same
+        bullet list - so they're rendered as Markdown without a round trip.
+        Returns None when the question should go to the LLM.
+        """
+        if user_message or context or not options or LOCAL_REWRITE_MAX_TOKENS <= 0:
+            return None
+        if _estimate_tokens(prompt) >= LOCAL_REWRITE_MAX_TOKENS:
+            return None
+        options_text = self.format_options_for_prompt(options)
+        if not options_text:
+            return None
+
+        self._local_rewrites += 1
+        logger.info(
+            f"Local rewrite for short question (local: {self._local_rewrites}, "
+            f"cache hits: {self._cache_hits}, misses: {self._cache_misses})"
+        )
+        return f"{prompt.strip()}\n\n{options_text}"
+
+    def _build_tone_prompts(
+        self,
+        prompt: str,
+        user_message: Optional[str] = None,
+        context: Optional[str] = None,
+        options: Optional[Union[str, List[Any]]] = None
+    ) -> Tuple[str, str]:
+        """
+        Build (system_prompt, user_prompt) for a question tone rewrite.
+
+        Static instructions come first and dynamic fields are appended at
+        the tail.
+        """
+        # Format options for the prompt (no allocation when there are none)
+        options_text = self.format_options_for_prompt(options) if options else ""
+        options_info = f"{_OPTIONS_HDR}{options_text}{_OPTIONS_FTR}" if options_text else ""
+
+        if user_message and context:
+            mode = "full"
+        elif user_message:
+            mode = "user_only"
+        else:
+            mode = "rewrite"
+
+        user_prompt = USER_TEMPLATES[mode].substitute(
+            context=context or "",
+            user_message=user_message or "",
+            prompt=prompt,
+            options_info=options_info,
+        )
+        return SYSTEM_PROMPTS[mode], user_prompt
+
     def modify_question_tone(
         self, 
         prompt: str, 
@@ -62,215 +562,517 @@ class QuestionService:
         options: Optional[Union[str, List[Any]]] = None
     ) -> str:
         """Modify question tone to be friendly and engaging."""
-        # Format options for the prompt
-        options_text = self.format_options_for_prompt(options)
-        options_info = ""
-        if options_text:
-            options_info = f"\n\nAvailable options:\n{options_text}\n\nPlease naturally incorporate these options into the question when modifying it. Format the options nicely in Markdown."
-        
-        if user_message and context:
-            system_prompt = """You are a friendly, genuine person having a soft, frank conversation. 
-            You'll acknowledge what the user just said in a warm, human way, then naturally ask the next question.
-            Use a soft, frank tone - be honest, straightforward, and warm. Be justifiable and reasonable.
-            Be genuinely friendly and curious - like talking to a friend. Use casual, everyday language.
-            If options are provided, include them naturally in Markdown format (as a bulleted list or inline text).
-            Return your response in Markdown format for better UI display."""
-            
-            user_prompt = f"""Previous conversation:
-{context}
+        local = self._local_rewrite(prompt, user_message, context, options)
+        if local is not None:
+            return local
 
-User's last response: "{user_message}"
+        system_prompt, user_prompt = self._build_tone_prompts(prompt, user_message, context, options)
+        cache_key = self._cache_key("tone", system_prompt, user_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-New question to ask: {prompt}{options_info}
+        result = self._chat(system_prompt, user_prompt)
 
-Create a natural, friendly response with a soft, frank tone that:
-1. Briefly acknowledges what the user said in a warm, casual way (like a friend would)
-2. Smoothly transitions to asking the new question in a friendly, conversational tone
-3. Use a soft, frank approach - be honest and straightforward but warm
-4. Be justifiable and reasonable - explain naturally why you're asking if it makes sense
-5. If options are provided, include them naturally in Markdown format (preferably as a bulleted list)
-6. Sound genuinely curious and human - not robotic or formal
+        # Clean up any unwanted introductory phrases (for first call only)
+        if not user_message and not context:
+            result = self._clean_introductory_text(result)
 
-Return the complete response in Markdown format."""
-        elif user_message:
-            system_prompt = """You are a friendly, genuine person having a soft, frank conversation. 
-            You'll acknowledge what the user just said in a warm, human way, then naturally ask the next question.
-            Use a soft, frank tone - be honest, straightforward, and warm. Be justifiable and reasonable.
-            Be genuinely friendly and curious - like talking to a friend. Use casual, everyday language.
-            If options are provided, include them naturally in Markdown format (as a bulleted list or inline text).
-            Return your response in Markdown format for better UI display."""
-            
-            user_prompt = f"""User's response: "{user_message}"
-
-New question to ask: {prompt}{options_info}
-
-Create a natural, friendly response with a soft, frank tone that:
-1. Briefly acknowledges what the user said in a warm, casual way (like a friend would)
-2. Smoothly transitions to asking the new question in a friendly, conversational tone
-3. Use a soft, frank approach - be honest and straightforward but warm
-4. Be justifiable and reasonable - explain naturally why you're asking if it makes sense
-5. If options are provided, include them naturally in Markdown format (preferably as a bulleted list)
-6. Sound genuinely curious and human - not robotic or formal
+        self._response_cache[cache_key] = result
+        return result
+    
+    async def modify_question_tone_async(
+        self,
+        prompt: str,
+        user_message: Optional[str] = None,
+        context: Optional[str] = None,
+        options: Optional[Union[str, List[Any]]] = None
+    ) -> str:
+        """Async variant of modify_question_tone for use from FastAPI handlers."""
+        local = self._local_rewrite(prompt, user_message, context, options)
+        if local is not None:
+            return local
 
-Return the complete response in Markdown format."""
-        else:
-            system_prompt = """You are a friendly, genuine person having a soft, frank conversation. 
-            Rewrite questions in a very friendly, casual, and human way - like you're genuinely curious and asking a friend.
-            Use a soft, frank tone - be honest, straightforward, and warm. Be justifiable and reasonable in your approach.
-            Use natural everyday language. Avoid formal or corporate tone.
-            If options are provided, include them naturally in Markdown format (as a bulleted list or inline text).
-            IMPORTANT: Return ONLY the modified question text. Do NOT add any introductory phrases, explanations, or meta-commentary.
-            Start directly with the question as if you're naturally asking it."""
-            
-            user_prompt = f"""Rewrite this question in a very friendly, casual, and human way with a soft, frank tone: {prompt}{options_info}
-
-STYLE GUIDELINES:
-- Use a soft, frank tone - be honest, straightforward, and warm
-- Be justifiable and reasonable - explain why you're asking if it makes sense naturally
-- Be warm, friendly, and genuinely curious
-- Use casual, everyday language (like talking to a friend)
-- Sound natural and human - not robotic or formal
-- Be direct but gentle - frank but soft
-- If options are provided, include them naturally in Markdown format (preferably as a bulleted list) within the question
-- Return ONLY the question text - no introductions, no explanations, just the friendly question itself"""
+        system_prompt, user_prompt = self._build_tone_prompts(prompt, user_message, context, options)
+        cache_key = self._cache_key("tone", system_prompt, user_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        _msgs = [{"role": "user", "content": user_prompt}]
-        try:
-            response = self.client.messages.create(
-                model=self.model, max_tokens=500, system=system_prompt, messages=_msgs, temperature=0.7
-            )
-            result = response.content[0].text.strip()
-        except Exception as api_err:
-            from app.services.llm_fallback import fallback_from_anthropic_error
-            result = fallback_from_anthropic_error(
-                service="chat", error=api_err, system_prompt=system_prompt, messages=_msgs, max_tokens=500, temperature=0.7
-            )
-            if not result:
-                logger.error(f"Claude API error: {str(api_err)}")
-                raise api_err
+        result = await self._chat_async(system_prompt, user_prompt)
 
         # Clean up any unwanted introductory phrases (for first call only)
         if not user_message and not context:
             result = self._clean_introductory_text(result)
 
+        self._response_cache[cache_key] = result
         return result
     
+    def _prepare_rewrite_batch(
+        self,
+        prompts: List[str],
+        options: Optional[List[Optional[Union[str, List[Any]]]]] = None
+    ) -> Tuple[List[Optional[str]], List[str], List[int], Optional[str]]:
+        """
+        Split a batch into cached results and the questions still to rewrite.
+
+        Returns (results, cache_keys, pending_indexes, batch_user_prompt);
+        batch_user_prompt is None when every question was already cached.
+        """
+        options = options or [None] * len(prompts)
+        results: List[Optional[str]] = []
+        cache_keys: List[str] = []
+        pending: List[int] = []
+        pending_blocks: List[str] = []
+
+        for i, (prompt, item_options) in enumerate(zip(prompts, options)):
+            system_prompt, user_prompt = self._build_tone_prompts(prompt, options=item_options)
+            key = self._cache_key("tone", system_prompt, user_prompt)
+            cache_keys.append(key)
+            cached = self._local_rewrite(prompt, None, None, item_options)
+            if cached is None:
+                cached = self._cache_get(key)
+            results.append(cached)
+            if cached is None:
+                pending.append(i)
+                options_text = self.format_options_for_prompt(item_options)
+                block = f"{len(pending)}. {prompt}"
+                if options_text:
+                    block += f"{_OPTIONS_HDR}{options_text}{_OPTIONS_FTR}"
+                pending_blocks.append(block)
+
+        if not pending:
+            return results, cache_keys, pending, None
+
+        batch_prompt = f"{BATCH_REWRITE_INSTRUCTIONS}\n\n" + "\n\n".join(pending_blocks)
+        return results, cache_keys, pending, batch_prompt
+
+    @staticmethod
+    def _parse_rewrite_batch(text: str, expected: int) -> Optional[List[str]]:
+        """Parse the {"questions": [...]} payload; None if malformed or misaligned."""
+        text = (text or "").strip()
+        if text.startswith("```"):
+            text = text.split("```")[1]
+            if text.startswith("json"):
+                text = text[4:]
+        try:
+            questions = _json_loads(text.strip())["questions"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not parse batched rewrite response: {e}")
+            return None
+        if (not isinstance(questions, list) or len(questions) != expected
+                or not all(isinstance(q, str) for q in questions)):
+            logger.warning(f"Batched rewrite returned a malformed questions list (expected {expected} strings)")
+            return None
+        return questions
+
+    def modify_questions_batch(
+        self,
+        prompts: List[str],
+        options: Optional[List[Optional[Union[str, List[Any]]]]] = None
+    ) -> List[str]:
+        """
+        Rewrite several first-call questions with a single LLM request.
+
+        Args:
+            prompts: Question prompts to rewrite
+            options: Optional per-question options, aligned with prompts
+
+        Returns:
+            Rewritten questions in the same order as prompts. Falls back to
+            per-question calls if the batched response can't be parsed.
+        """
+        results, cache_keys, pending, batch_prompt = self._prepare_rewrite_batch(prompts, options)
+        if batch_prompt is None:
+            return results
+
+        system_prompt = SYSTEM_PROMPT_BATCH_REWRITE
+        max_tokens = min(_CFG.max_tokens * len(pending), BATCH_MAX_TOKENS)
+        rewritten = None
+        try:
+            text = self._chat(system_prompt, batch_prompt, max_tokens=max_tokens, fallback=False)
+            rewritten = self._parse_rewrite_batch(text, len(pending))
+        except Exception as api_err:
+            logger.warning(f"Batched rewrite failed, falling back to per-question calls: {api_err}")
+
+        options = options or [None] * len(prompts)
+        for n, i in enumerate(pending):
+            if rewritten is None:
+                results[i] = self.modify_question_tone(prompts[i], options=options[i])
+            else:
+                results[i] = self._clean_introductory_text(rewritten[n].strip())
+                self._response_cache[cache_keys[i]] = results[i]
+        return results
+
+    async def modify_questions_batch_async(
+        self,
+        prompts: List[str],
+        options: Optional[List[Optional[Union[str, List[Any]]]]] = None
+    ) -> List[str]:
+        """Async variant of modify_questions_batch."""
+        results, cache_keys, pending, batch_prompt = self._prepare_rewrite_batch(prompts, options)
+        if batch_prompt is None:
+            return results
+
+        system_prompt = SYSTEM_PROMPT_BATCH_REWRITE
+        max_tokens = min(_CFG.max_tokens * len(pending), BATCH_MAX_TOKENS)
+        rewritten = None
+        try:
+            text = await self._chat_async(system_prompt, batch_prompt, max_tokens=max_tokens, fallback=False)
+            rewritten = self._parse_rewrite_batch(text, len(pending))
+        except Exception as api_err:
+            logger.warning(f"Batched rewrite failed, falling back to per-question calls: {api_err}")
+
+        options = options or [None] * len(prompts)
+        if rewritten is None:
+            fallback = await asyncio.gather(*(
+                self.modify_question_tone_async(prompts[i], options=options[i]) for i in pending
+            ))
+            for i, text in zip(pending, fallback):
+                results[i] = text
+            return results
+
+        for n, i in enumerate(pending):
+            results[i] = self._clean_introductory_text(rewritten[n].strip())
+            self._response_cache[cache_keys[i]] = results[i]
+        return results
+
+    def submit_batch_rewrite(
+        self,
+        prompts: List[str],
+        options: Optional[List[Optional[Union[str, List[Any]]]]] = None
+    ) -> str:
+        """
+        Submit first-call rewrites for offline processing via the Message Batches API.
+
+        Meant for bulk, non-interactive jobs (e.g. regenerating every question
+        in a schema): batch requests are billed at a discount and don't count
+        against the real-time rate limits. Each request's custom_id is the
+        prompt's index, so results can be realigned with the input order.
+
+        Returns:
+            The batch id, for poll_batch / fetch_batch_results
+        """
+        options = options or [None] * len(prompts)
+        requests = []
+        for i, (prompt, item_options) in enumerate(zip(prompts, options)):
+            system_prompt, user_prompt = self._build_tone_prompts(prompt, options=item_options)
+            requests.append({
+                "custom_id": str(i),
+                "params": {
+                    "model": self.model,
+                    "max_tokens": _CFG.max_tokens,
+                    "temperature": _CFG.temperature,
+                    "system": system_prompt,
+                    "messages": [{"role": "user", "content": user_prompt}],
+                },
+            })
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted question rewrite batch {batch.id} ({len(requests)} requests)")
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Return processing status and request counts for a rewrite batch."""
+        batch = self.client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return {
+            "batch_id": batch.id,
+            "status": batch.processing_status,
+            "succeeded": counts.succeeded,
+            "errored": counts.errored,
+            "processing": counts.processing,
+            "canceled": counts.canceled,
+            "expired": counts.expired,
+        }
+
+    def fetch_batch_results(self, batch_id: str) -> Dict[int, str]:
+        """
+        Collect results of a finished rewrite batch.
+
+        Returns:
+            Mapping of prompt index -> cleaned rewritten question. Requests
+            that errored or expired are left out so callers can resubmit them.
+        """
+        results: Dict[int, str] = {}
+        failed = 0
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                failed += 1
+                continue
+            text = entry.result.message.content[0].text.strip()
+            results[int(entry.custom_id)] = self._clean_introductory_text(text)
+
+        logger.info(f"Fetched question rewrite batch {batch_id}: {len(results)} succeeded, {failed} failed")
+        return results
+
     def _clean_introductory_text(self, text: str) -> str:
         """Remove common introductory phrases and meta-commentary that LLM might add."""
         if not text:
             return text
-        
-        # Common patterns to remove (case-insensitive)
-        patterns_to_remove = [
-            r"^Sure!?\s*",
-            r"^Here's?\s*",
-            r"^Here is\s*",
-            r"^Let me\s+",
-            r"^I'll\s+",
-            r"^I will\s+",
-            r"^Of course!?\s*",
-            r"^Absolutely!?\s*",
-            r"^Certainly!?\s*",
-            r"^a friendlier (and more engaging )?version\s*",
-            r"^an engaging version\s*",
-            r"^a more engaging version\s*",
-        ]
-        
-        result = text
-        
-        # Remove patterns at the start
-        for pattern in patterns_to_remove:
-            result = re.sub(pattern, "", result, flags=re.IGNORECASE)
-        
-        # Remove separator lines (---, ===, etc.) at the start
-        lines = result.split('\n')
-        cleaned_lines = []
-        skip_separators = True
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Skip separator lines at the start
-            if skip_separators:
-                if not line_stripped:
-                    continue
-                if line_stripped.replace('-', '').replace('=', '').replace('_', '').strip() == '':
-                    continue
-                if line_stripped.startswith(('---', '===', '___')):
-                    continue
-            
-            # Once we have real content, stop skipping
-            if line_stripped:
-                skip_separators = False
-            
-            cleaned_lines.append(line)
-        
-        result = '\n'.join(cleaned_lines).strip()
-        
-        # Remove any remaining "Here's a friendlier version:" type patterns
-        result = re.sub(r"^(Here's?|Sure!?|Let me|I'll|I will)\s+[^:]*:\s*", "", result, flags=re.IGNORECASE)
-        
+
         # Remove leading/trailing whitespace and newlines
-        return result.strip()
-    
-    def generate_followup_question(self, ai_text: str, original_prompt: str) -> str:
-        """Generate a follow-up question for suggestion chips."""
-        system_prompt = """You are a friendly, genuine person creating follow-up questions with a soft, frank tone.
-        Given a question that was just asked, create a related follow-up question that:
-        1. Is a natural continuation or related to the original question
-        2. Is concise and suitable for a suggestion chip/button
-        3. Uses a soft, frank tone - honest, straightforward, and warm
-        4. Is justifiable and reasonable - makes sense naturally
-        5. Is friendly and conversational
-        6. Helps guide the conversation forward
-        
-        Return only the follow-up question in plain text (no Markdown, no quotes, just the question)."""
-        
-        user_prompt = f"""The following question was just asked to a user:
-{ai_text}
+        return self._strip_intro_prefix(text).rstrip()
 
-Original prompt context: {original_prompt}
+    def _strip_intro_prefix(self, text: str) -> str:
+        """
+        Left-side half of _clean_introductory_text.
 
-Create a concise, friendly follow-up question with a soft, frank tone that:
-- Relates to this question and helps continue the conversation naturally
-- Uses a soft, frank approach - honest and straightforward but warm
-- Is justifiable and reasonable - makes sense in context
-- Is friendly and conversational
+        Every cleanup pattern is anchored at the start, so this also works on
+        the first buffered chunk of a streamed response.
+        """
+        # Remove intro phrases at the start (one pass over the fused pattern)
+        result = _INTRO_PHRASES_RE.sub("", text)
 
-Return only the question text, nothing else."""
+        # Remove blank and separator lines (---, ===, etc.) at the start
+        result = _LEADING_SEPARATORS_RE.sub("", result).lstrip()
+
+        # Remove any remaining "Here's a friendlier version:" type patterns
+        return _INTRO_LEAD_IN_RE.sub("", result).lstrip()
+
+    async def modify_question_tone_stream(
+        self,
+        prompt: str,
+        user_message: Optional[str] = None,
+        context: Optional[str] = None,
+        options: Optional[Union[str, List[Any]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a question tone rewrite as text chunks arrive.
 
+        Time-to-first-token replaces total generation time as the perceived
+        latency. For first-call rewrites the first STREAM_CLEANUP_BUFFER_CHARS
+        characters are held back so intro phrases can still be removed.
+        """
+        local = self._local_rewrite(prompt, user_message, context, options)
+        if local is not None:
+            yield local
+            return
+
+        system_prompt, user_prompt = self._build_tone_prompts(prompt, user_message, context, options)
+        cache_key = self._cache_key("tone", system_prompt, user_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        needs_cleanup = not user_message and not context
         _msgs = [{"role": "user", "content": user_prompt}]
+        emitted: List[str] = []
+        buffer = ""
         try:
-            response = self.client.messages.create(
-                model=self.model, max_tokens=500, system=system_prompt, messages=_msgs, temperature=0.7
-            )
-            followup = response.content[0].text.strip()
+            async with _LLM_SEMAPHORE, self.async_client.messages.stream(
+                model=self.model, max_tokens=_CFG.max_tokens, system=system_prompt, messages=_msgs,
+                temperature=_CFG.temperature
+            ) as stream:
+                async for text in stream.text_stream:
+                    if not emitted:
+                        # Hold back the prefix until there's enough to clean
+                        buffer += text
+                        if len(buffer) < STREAM_CLEANUP_BUFFER_CHARS:
+                            continue
+                        text = self._strip_intro_prefix(buffer) if needs_cleanup else buffer.lstrip()
+                        if not text:
+                            continue
+                    emitted.append(text)
+                    yield text
         except Exception as api_err:
+            if emitted:
+                # Can't retry transparently once the client has partial output
+                logger.error(f"Claude streaming error after partial output: {str(api_err)}")
+                raise
             from app.services.llm_fallback import fallback_from_anthropic_error
-            followup = fallback_from_anthropic_error(
-                service="chat", error=api_err, system_prompt=system_prompt, messages=_msgs, max_tokens=500, temperature=0.7
+            result = await asyncio.to_thread(
+                fallback_from_anthropic_error,
+                service="chat", error=api_err, system_prompt=system_prompt, messages=_msgs,
+                max_tokens=_CFG.max_tokens, temperature=_CFG.temperature
             )
-            if not followup:
-                logger.error(f"Error generating follow-up question: {str(api_err)}")
+            if not result:
+                logger.error(f"Claude API error: {str(api_err)}")
                 raise api_err
+            result = self._clean_introductory_text(result) if needs_cleanup else result.strip()
+            self._response_cache[cache_key] = result
+            yield result
+            return
+
+        if not emitted:
+            # Short response that never filled the cleanup buffer
+            text = self._strip_intro_prefix(buffer) if needs_cleanup else buffer.lstrip()
+            if text:
+                emitted.append(text)
+                yield text
+
+        self._response_cache[cache_key] = "".join(emitted).rstrip()
+
+    def _build_followup_prompts(self, ai_text: str, original_prompt: str) -> Tuple[str, str]:
+        """Build (system_prompt, user_prompt) for a follow-up suggestion chip."""
+        user_prompt = f"""{FOLLOWUP_INSTRUCTIONS}
+
+The following question was just asked to a user:
+{ai_text}
+
+Original prompt context: {original_prompt}"""
+
+        return SYSTEM_PROMPT_FOLLOWUP, user_prompt
+
+    def generate_followup_question(self, ai_text: str, original_prompt: str) -> str:
+        """Generate a follow-up question for suggestion chips."""
+        system_prompt, user_prompt = self._build_followup_prompts(ai_text, original_prompt)
+        cache_key = self._cache_key("followup", system_prompt, user_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        followup = self._chat(system_prompt, user_prompt)
+        # Remove any quotes if present
+        followup = followup.strip('"').strip("'").strip()
+        self._response_cache[cache_key] = followup
+        return followup
+    
+    async def generate_followup_question_async(self, ai_text: str, original_prompt: str) -> str:
+        """Async variant of generate_followup_question."""
+        system_prompt, user_prompt = self._build_followup_prompts(ai_text, original_prompt)
+        cache_key = self._cache_key("followup", system_prompt, user_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        followup = await self._chat_async(system_prompt, user_prompt)
         # Remove any quotes if present
         followup = followup.strip('"').strip("'").strip()
+        self._response_cache[cache_key] = followup
         return followup
     
-    def build_conversation_context(self, previous_responses: List[Any]) -> Optional[str]:
-        """Build conversation context from previous responses."""
+    @staticmethod
+    def _answered_turns(previous_responses: Optional[List[Any]]) -> List[str]:
+        """Format answered turns as "AI: ...\nUser: ..." blocks, oldest first."""
         if not previous_responses:
+            return []
+        # Only include responses where user_response has a value
+        return [
+            f"AI: {prev.ai_text}\nUser: {prev.user_response}"
+            for prev in previous_responses
+            if getattr(prev, 'user_response', None)
+        ]
+
+    @staticmethod
+    def _history_cutoff(turn_count: int, window: int) -> int:
+        """
+        Index splitting summarized turns from verbatim ones.
+
+        The cutoff only advances in steps of `window`, so between steps the
+        summarized part (and its cached summary) stays the same and new turns
+        are only appended at the tail - keeping the prompt prefix stable.
+        Between `window` and 2*window-1 recent turns are kept verbatim.
+        """
+        if window <= 0:
+            return turn_count
+        if turn_count <= window:
+            return 0
+        return ((turn_count - window) // window) * window
+
+    def build_conversation_context(
+        self,
+        previous_responses: List[Any],
+        window: int = CONTEXT_WINDOW_TURNS,
+        summary: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Build conversation context from previous responses.
+
+        Args:
+            previous_responses: Earlier AI/user exchanges, oldest first
+            window: Recent answered turns to keep verbatim (see _history_cutoff)
+            summary: Summary of the older turns (from summarize_history); when
+                omitted, older turns are dropped
+
+        Returns:
+            "AI: ...\nUser: ..." transcript, or None if nothing was answered
+        """
+        turns = self._answered_turns(previous_responses)
+        if not turns:
             return None
-        
-        context_parts = []
-        for prev in previous_responses:
-            # Only include responses where user_response has a value
-            if hasattr(prev, 'user_response') and prev.user_response:
-                context_parts.append(f"AI: {prev.ai_text}")
-                context_parts.append(f"User: {prev.user_response}")
-        
-        if not context_parts:
+
+        cutoff = self._history_cutoff(len(turns), window)
+        recent = "\n".join(turns[cutoff:])
+        if cutoff and summary:
+            return f"Summary of earlier conversation: {summary}\n{recent}" if recent else f"Summary of earlier conversation: {summary}"
+        return recent or None
+
+    def _prepare_summary(
+        self,
+        previous_responses: List[Any],
+        window: int
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Return (cached_summary, cache_key, user_prompt) for the older turns."""
+        turns = self._answered_turns(previous_responses)
+        cutoff = self._history_cutoff(len(turns), window)
+        if not cutoff:
+            return None, None, None
+
+        user_prompt = f"{SUMMARY_INSTRUCTIONS}\n\nConversation:\n" + "\n".join(turns[:cutoff])
+        cache_key = self._cache_key("summary", SUMMARY_SYSTEM_PROMPT, user_prompt)
+        return self._cache_get(cache_key), cache_key, user_prompt
+
+    def cached_history_summary(
+        self,
+        previous_responses: List[Any],
+        window: int = CONTEXT_WINDOW_TURNS
+    ) -> Optional[str]:
+        """
+        Summary of the older turns if it was already computed, else None.
+
+        Never calls the LLM, so it is safe on the request path; pair it with
+        summarize_history_async in a background task to fill the cache.
+        """
+        summary, _, _ = self._prepare_summary(previous_responses, window)
+        return summary
+
+    def summarize_history(
+        self,
+        previous_responses: List[Any],
+        window: int = CONTEXT_WINDOW_TURNS
+    ) -> Optional[str]:
+        """
+        Summarize the answered turns that fall outside the verbatim window.
+
+        One short LLM call per window step; the result is cached, so the same
+        summary is reused until the cutoff advances again. Returns None when
+        there is nothing to summarize or the call fails (older turns are then
+        simply dropped from the context).
+        """
+        summary, cache_key, user_prompt = self._prepare_summary(previous_responses, window)
+        if summary is not None or user_prompt is None:
+            return summary
+
+        try:
+            summary = self._chat(
+                SUMMARY_SYSTEM_PROMPT, user_prompt, max_tokens=SUMMARY_MAX_TOKENS, temperature=0.3, fallback=False
+            )
+        except Exception as e:
+            logger.warning(f"Failed to summarize conversation history: {str(e)}")
+            return None
+
+        self._response_cache[cache_key] = summary
+        return summary
+
+    async def summarize_history_async(
+        self,
+        previous_responses: List[Any],
+        window: int = CONTEXT_WINDOW_TURNS
+    ) -> Optional[str]:
+        """Async variant of summarize_history."""
+        summary, cache_key, user_prompt = self._prepare_summary(previous_responses, window)
+        if summary is not None or user_prompt is None:
+            return summary
+
+        try:
+            summary = await self._chat_async(
+                SUMMARY_SYSTEM_PROMPT, user_prompt, max_tokens=SUMMARY_MAX_TOKENS, temperature=0.3, fallback=False
+            )
+        except Exception as e:
+            logger.warning(f"Failed to summarize conversation history: {str(e)}")
             return None
-        
-        return "\n".join(context_parts)
 
+        self._response_cache[cache_key] = summary
+        return summary
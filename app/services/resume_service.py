@@ -5,32 +5,143 @@ Supports two modes:
 1. URL mode: Download resume from URL (legacy)
 2. Base64 mode: Process base64-encoded content from conversational upload
 """
-from typing import Optional, Dict, Any, Set, Union
-from urllib.parse import urlparse
+from typing import Optional, Dict, Any, Callable, FrozenSet, Tuple, Union
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+import io
 import os
-import tempfile
-import shutil
+import hashlib
 import logging
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from langchain_community.document_loaders import PyPDFLoader, Docx2txtLoader, TextLoader
-from app.adapters.supabase_profiles import UserProfile
+from app.adapters.supabase_profiles import UserProfile, ResumeTextData
+
+try:
+    # Fast PDF text extraction; AGPL-3.0, so optional (see _extract_pdf_text)
+    import fitz  # PyMuPDF
+except ImportError:  # pragma: no cover - PyMuPDF is optional
+    fitz = None
 
 logger = logging.getLogger(__name__)
 
 # SECURITY: Maximum file size for resume downloads (10MB default)
 MAX_RESUME_SIZE_BYTES = int(os.getenv('MAX_RESUME_SIZE_MB', '10')) * 1024 * 1024
+MAX_RESUME_SIZE_LABEL = f"{MAX_RESUME_SIZE_BYTES // (1024 * 1024)}MB"  # for error messages
+
+# Longest base64 payload that can decode to MAX_RESUME_SIZE_BYTES (+4 slack)
+MAX_RESUME_BASE64_CHARS = (MAX_RESUME_SIZE_BYTES + 2) // 3 * 4 + 4
 
 # SECURITY: Request timeout in seconds
 RESUME_DOWNLOAD_TIMEOUT = int(os.getenv('RESUME_DOWNLOAD_TIMEOUT', '30'))
 
+# Parallel Range requests per direct download and the smallest file worth
+# splitting - below ~1MB the extra round trips cost more than they save.
+# Opt-in (default 1 = off): splitting costs a HEAD probe on every download.
+RESUME_DOWNLOAD_STREAMS = int(os.getenv('RESUME_DOWNLOAD_STREAMS', '1'))
+RESUME_MULTISTREAM_MIN_BYTES = int(os.getenv('RESUME_MULTISTREAM_MIN_BYTES', str(1024 * 1024)))
+
 # SECURITY: Allowed domains for direct resume downloads (SSRF protection)
 # If empty, only backend-proxied downloads are allowed
-ALLOWED_RESUME_DOMAINS: Set[str] = set(
+ALLOWED_RESUME_DOMAINS: FrozenSet[str] = frozenset(
     filter(None, os.getenv('ALLOWED_RESUME_DOMAINS', '').split(','))
 )
 
+# Development mode: direct downloads allowed without an allowlist
+LOCAL_MODE = bool(os.getenv("LOCAL_MODE", ""))
+
+# Shared HTTP session so warm workers reuse TCP/TLS connections (the backend
+# proxy is the same host on every call). Pool covers parallel Range requests.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+
+def _extract_pdf_text(content: bytes) -> Tuple[str, str]:
+    """
+    Extract text from PDF bytes, returning (text, extraction_method).
+
+    Uses PyMuPDF when it is installed, which is several times faster than
+    pypdf for plain text extraction. PyMuPDF is AGPL-3.0 licensed, so it is
+    not in requirements.txt; deployments cleared to use it install it
+    themselves. Falls back to pypdf if PyMuPDF is missing or can't open the
+    file, so malformed PDFs that pypdf tolerates still parse.
+    """
+    if fitz is not None:
+        try:
+            with fitz.open(stream=content, filetype="pdf") as doc:
+                return "\n\n".join(page.get_text("text") for page in doc), "PyMuPDF"
+        except Exception as e:
+            logger.warning(f"PyMuPDF extraction failed, falling back to pypdf: {e}")
+
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    return "\n\n".join(page.extract_text() or "" for page in reader.pages), "pypdf"
+
+
+def _extract_docx_text(content: bytes) -> Tuple[str, str]:
+    """Extract text from DOCX bytes."""
+    import docx2txt
+
+    return docx2txt.process(io.BytesIO(content)), "docx2txt"
+
+
+def _extract_txt_text(content: bytes) -> Tuple[str, str]:
+    """Decode plain-text resume bytes, replacing invalid UTF-8."""
+    return content.decode("utf-8", errors="replace"), "text"
+
+
+# File suffix by substring of the upload MIME type, checked in order and
+# before the filename ("word" covers both DOCX and legacy msword types)
+_SUFFIX_BY_MIME_FRAGMENT: Tuple[Tuple[str, str], ...] = (
+    ("pdf", ".pdf"),
+    ("word", ".docx"),
+)
+
+# Text extractor by file suffix. Parser libraries are imported on first use
+# so workers that never see a given file type don't pay its import cost.
+_EXTRACTORS: Dict[str, Callable[[bytes], Tuple[str, str]]] = {
+    ".pdf": _extract_pdf_text,
+    ".docx": _extract_docx_text,
+    ".txt": _extract_txt_text,
+    ".text": _extract_txt_text,
+}
+
+
+def _resume_fingerprint(content_hash: str, resume_text: str) -> str:
+    """
+    Bind an upload's content hash to the resume text stored from it.
+
+    Any other writer of resume_text (URL processing, manual edits) changes the
+    text half, so a stale cache entry can never make a re-upload look unchanged.
+    """
+    text_hash = hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+    return f"{content_hash}:{text_hash}"
+
+
+def _resolve_suffix(filename: str, content_type: str) -> str:
+    """File suffix from a PDF/Word MIME type, else the filename, defaulting to .pdf."""
+    content_type = content_type.lower()
+    for fragment, suffix in _SUFFIX_BY_MIME_FRAGMENT:
+        if fragment in content_type:
+            return suffix
+    return os.path.splitext(filename)[1].lower() or '.pdf'
+
+
+def _extract_text(content: bytes, suffix: str) -> Tuple[str, str]:
+    """
+    Extract text from in-memory resume bytes, returning (text, extraction_method).
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    extractor = _EXTRACTORS.get(suffix)
+    if extractor is None:
+        raise ValueError(f"Unsupported file type: {suffix}")
+    return extractor(content)
+
 
 class ResumeService:
     """Service for resume processing operations."""
@@ -49,20 +160,15 @@ class ResumeService:
         - Allowlist is empty AND local_mode is set (development)
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove port if present
-            if ':' in domain:
-                domain = domain.split(':')[0]
+            # hostname drops userinfo and port, unbrackets IPv6 and lowercases
+            domain = urlsplit(url).hostname or ""
 
             # Check against allowlist
             if ALLOWED_RESUME_DOMAINS:
                 return domain in ALLOWED_RESUME_DOMAINS
 
             # If no allowlist configured, only allow in local mode
-            local_mode = os.getenv("LOCAL_MODE", "")
-            if local_mode:
+            if LOCAL_MODE:
                 logger.warning(f"No ALLOWED_RESUME_DOMAINS configured - allowing {domain} in local mode")
                 return True
 
@@ -71,15 +177,96 @@ class ResumeService:
             logger.error(f"Error parsing URL {url}: {e}")
             return False
 
-    def _download_with_size_limit(self, url: str, headers: Dict[str, str] = None) -> bytes:
+    def _mark_failed(self, user_id: str, status: str) -> None:
+        """Record a failure status without fetching and re-saving the profile."""
+        try:
+            if not UserProfile.update_processing_status(user_id, status):
+                logger.warning(f"Could not record status {status} for user {user_id}")
+        except Exception as e:
+            logger.warning(f"Could not record status {status} for user {user_id}: {e}")
+
+    def _download_multistream(self, url: str, headers: Dict[str, str] = None, nchunks: int = RESUME_DOWNLOAD_STREAMS) -> Optional[bytes]:
+        """
+        Download a large file as parallel byte-range requests.
+
+        A single stream over a high-latency link is capped by RTT x window
+        size; splitting the file into concurrent Range requests fills the
+        pipe. Returns None when the file is small or the server doesn't
+        support ranges, so the caller can fall back to a single stream.
+
+        Raises:
+            ValueError: If file exceeds size limit
+        """
+        if nchunks < 2:
+            return None
+        headers = headers or {}
+        try:
+            head = _SESSION.head(url, headers=headers, timeout=RESUME_DOWNLOAD_TIMEOUT, allow_redirects=True)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD failed, using single-stream download: {e}")
+            return None
+        if head.status_code != 200 or head.headers.get('Accept-Ranges', '').lower() != 'bytes':
+            return None
+
+        content_length = int(head.headers.get('Content-Length') or 0)
+        if content_length > MAX_RESUME_SIZE_BYTES:
+            raise ValueError(f"Resume file too large: {content_length / 1024 / 1024:.1f}MB exceeds {MAX_RESUME_SIZE_LABEL} limit")
+        if content_length < RESUME_MULTISTREAM_MIN_BYTES:
+            return None
+
+        step = -(-content_length // nchunks)  # ceil division
+        ranges = [(start, min(start + step, content_length) - 1) for start in range(0, content_length, step)]
+
+        def fetch(byte_range) -> Optional[bytes]:
+            start, end = byte_range
+            expected = end - start + 1
+            with _SESSION.get(
+                url,
+                headers={**headers, "Range": f"bytes={start}-{end}"},
+                stream=True,
+                timeout=RESUME_DOWNLOAD_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                # 200 means the server ignored the Range header - don't read
+                # the whole file once per chunk
+                if response.status_code != 206:
+                    return None
+                part = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    part.extend(chunk)
+                    if len(part) > expected:
+                        return None
+                return bytes(part) if len(part) == expected else None
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                parts = list(pool.map(fetch, ranges))
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Range download failed, using single-stream download: {e}")
+            return None
+        if any(part is None for part in parts):
+            logger.warning("Server did not honour Range requests, using single-stream download")
+            return None
+
+        return b''.join(parts)
+
+    def _download_with_size_limit(self, url: str, headers: Dict[str, str] = None, multistream: bool = True) -> bytes:
         """
         Download file with size limit and timeout (DoS protection).
 
+        With multistream (and RESUME_DOWNLOAD_STREAMS > 1), large files on
+        servers that support Range requests are fetched in parallel chunks;
+        everything else is streamed in one request.
+
         Raises:
             ValueError: If file exceeds size limit
             requests.RequestException: If download fails
         """
-        response = requests.get(
+        content = self._download_multistream(url, headers) if multistream else None
+        if content is not None:
+            return content
+
+        response = _SESSION.get(
             url,
             headers=headers or {},
             stream=True,
@@ -90,38 +277,46 @@ class ResumeService:
         # Check Content-Length header first (if available)
         content_length = response.headers.get('Content-Length')
         if content_length and int(content_length) > MAX_RESUME_SIZE_BYTES:
-            raise ValueError(f"Resume file too large: {int(content_length) / 1024 / 1024:.1f}MB exceeds {MAX_RESUME_SIZE_BYTES / 1024 / 1024:.0f}MB limit")
-
-        # Stream download with size enforcement
-        chunks = []
-        total_size = 0
-        for chunk in response.iter_content(chunk_size=8192):
-            total_size += len(chunk)
-            if total_size > MAX_RESUME_SIZE_BYTES:
-                raise ValueError(f"Resume file exceeds {MAX_RESUME_SIZE_BYTES / 1024 / 1024:.0f}MB size limit")
-            chunks.append(chunk)
-
-        return b''.join(chunks)
+            raise ValueError(f"Resume file too large: {int(content_length) / 1024 / 1024:.1f}MB exceeds {MAX_RESUME_SIZE_LABEL} limit")
+
+        # Stream download with size enforcement, growing one buffer in place
+        # instead of keeping a list of chunks to join at the end
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buf.extend(chunk)
+            if len(buf) > MAX_RESUME_SIZE_BYTES:
+                raise ValueError(f"Resume file exceeds {MAX_RESUME_SIZE_LABEL} size limit")
+
+        return bytes(buf)
     
     def _cleanup_text(self, text: str) -> str:
         """Clean up extracted text by normalizing whitespace and removing excessive blank lines."""
         if not text:
             return ""
-        lines = [line.strip() for line in text.splitlines()]
-        text = "\n".join(line for line in lines if line)
-        return text.strip()
+        # map/filter keep the strip and blank-line drop in C; a whitespace
+        # regex measured ~2x slower on extracted resume text
+        return "\n".join(filter(None, map(str.strip, text.splitlines())))
     
+    def _store_resume_text(self, user_profile: UserProfile, text: str, extraction_method: str) -> None:
+        """
+        Set extracted resume text on the profile (caller saves).
+
+        Updates BOTH resume_text and resume_text_data.
+        BUG FIX: _sync_from_nested_objects() overwrites the flat resume_text
+        columns from resume_text_data during save(), so setting only the flat
+        attributes lost the extracted text. resume_text_data is the source of
+        truth; it's replaced in one assignment and the flat columns mirror it.
+        """
+        data = ResumeTextData(text=text, extracted_at=datetime.utcnow(), extraction_method=extraction_method)
+        user_profile.resume_text_data = data
+        user_profile.resume_text = data.text  # Plain string for DB column
+        user_profile.resume_extracted_at = data.extracted_at
+        user_profile.resume_extraction_method = data.extraction_method
+
     def _get_file_extension(self, url: str) -> str:
         """Extract file extension from URL."""
         return os.path.splitext(url.split('?')[0])[1].lower()
     
-    def _save_upload_to_temp(self, content: bytes, suffix: str) -> str:
-        """Save content to temporary file and return path."""
-        fd, path = tempfile.mkstemp(suffix=suffix or "")
-        with os.fdopen(fd, "wb") as f:
-            f.write(content)
-        return path
-
     def extract_text_from_content(self, content: bytes, filename: str, content_type: str) -> Dict[str, Any]:
         """
         Extract text from resume content WITHOUT database operations.
@@ -147,68 +342,39 @@ class ResumeService:
                 return {
                     "success": False,
                     "text": "",
-                    "error": f"File too large: exceeds {MAX_RESUME_SIZE_BYTES / 1024 / 1024:.0f}MB limit"
+                    "error": f"File too large: exceeds {MAX_RESUME_SIZE_LABEL} limit"
                 }
 
             # Determine file extension
-            if 'pdf' in content_type.lower():
-                suffix = '.pdf'
-            elif 'word' in content_type.lower() or filename.endswith('.docx'):
-                suffix = '.docx'
-            elif filename.endswith('.doc'):
-                suffix = '.doc'
-            elif filename.endswith('.txt'):
-                suffix = '.txt'
-            else:
-                suffix = os.path.splitext(filename)[1].lower() or '.pdf'
-
-            # Save to temp file
-            temp_path = self._save_upload_to_temp(content, suffix)
+            suffix = _resolve_suffix(filename, content_type)
 
+            # Extract text straight from memory
             try:
-                # Extract text
-                text = ""
-                if suffix == '.pdf':
-                    loader = PyPDFLoader(temp_path)
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                elif suffix == '.docx':
-                    loader = Docx2txtLoader(temp_path)
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                elif suffix in ('.txt', '.text'):
-                    loader = TextLoader(temp_path, encoding="utf-8")
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                else:
-                    return {
-                        "success": False,
-                        "text": "",
-                        "error": f"Unsupported file type: {suffix}"
-                    }
-
-                # Clean up the text
-                text = self._cleanup_text(text)
-
-                if not text:
-                    return {
-                        "success": False,
-                        "text": "",
-                        "error": "No text extracted from resume"
-                    }
+                text, _ = _extract_text(content, suffix)
+            except ValueError as e:
+                return {
+                    "success": False,
+                    "text": "",
+                    "error": str(e)
+                }
 
-                logger.info(f"Extracted {len(text)} characters from resume ({filename})")
+            # Clean up the text
+            text = self._cleanup_text(text)
 
+            if not text:
                 return {
-                    "success": True,
-                    "text": text,
-                    "error": None
+                    "success": False,
+                    "text": "",
+                    "error": "No text extracted from resume"
                 }
 
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            logger.info(f"Extracted {len(text)} characters from resume ({filename})")
+
+            return {
+                "success": True,
+                "text": text,
+                "error": None
+            }
 
         except Exception as e:
             logger.error(f"Error extracting text from resume {filename}: {e}")
@@ -232,9 +398,25 @@ class ResumeService:
         logger.info(f"Processing base64 resume for user {user_id}: {resume_data.get('filename', 'unknown')}")
 
         try:
-            # Decode base64 content
+            # Decode base64 content. Non-validating decode skips the regex
+            # pre-scan and ignores stray whitespace/newlines in C; the ASCII
+            # encode is the only copy made before decoding.
             content_b64 = resume_data.get('content', '')
-            content = base64.b64decode(content_b64)
+            # Reject oversized payloads before allocating the decoded copy.
+            # Line-wrapped (MIME) base64 is longer than its data, so only count
+            # newlines when the raw length is over the bound.
+            if len(content_b64) > MAX_RESUME_BASE64_CHARS:
+                newline_chars = content_b64.count('\n') + content_b64.count('\r')
+                if len(content_b64) - newline_chars > MAX_RESUME_BASE64_CHARS:
+                    return {
+                        "success": False,
+                        "skipped": False,
+                        "reason": "File too large",
+                        "message": f"Resume exceeds {MAX_RESUME_SIZE_LABEL} size limit"
+                    }
+            if isinstance(content_b64, str):
+                content_b64 = content_b64.encode('ascii')
+            content = base64.b64decode(content_b64, validate=False)
             filename = resume_data.get('filename', 'resume.pdf')
             content_type = resume_data.get('content_type', 'application/pdf')
 
@@ -244,19 +426,12 @@ class ResumeService:
                     "success": False,
                     "skipped": False,
                     "reason": "File too large",
-                    "message": f"Resume exceeds {MAX_RESUME_SIZE_BYTES / 1024 / 1024:.0f}MB size limit"
+                    "message": f"Resume exceeds {MAX_RESUME_SIZE_LABEL} size limit"
                 }
+            content_hash = hashlib.sha256(content).hexdigest()
 
             # Determine file extension from content type or filename
-            if 'pdf' in content_type.lower():
-                suffix = '.pdf'
-            elif 'word' in content_type.lower() or filename.endswith('.docx'):
-                suffix = '.docx'
-            elif filename.endswith('.doc'):
-                suffix = '.doc'
-            else:
-                # Fallback to extension from filename
-                suffix = os.path.splitext(filename)[1].lower() or '.pdf'
+            suffix = _resolve_suffix(filename, content_type)
 
             # Get/create user profile
             try:
@@ -270,68 +445,51 @@ class ResumeService:
                     "message": f"User profile {user_id} not found"
                 }
 
-            user_profile.processing_status = 'processing'
-            user_profile.save()
-
-            # Save to temp file and extract text
-            temp_path = self._save_upload_to_temp(content, suffix)
-            try:
-                text = ""
-                if suffix == '.pdf':
-                    loader = PyPDFLoader(temp_path)
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                    extraction_method = "PyPDFLoader"
-                elif suffix == '.docx':
-                    loader = Docx2txtLoader(temp_path)
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                    extraction_method = "Docx2txtLoader"
-                elif suffix in ('.txt', '.text'):
-                    loader = TextLoader(temp_path, encoding="utf-8")
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                    extraction_method = "TextLoader"
-                else:
-                    raise ValueError(f"Unsupported file type: {suffix}")
-
-                # Clean up the text
-                text = self._cleanup_text(text)
-
-                if not text:
-                    raise ValueError("No text extracted from the resume")
-
-                # Store extracted text — update BOTH resume_text and resume_text_data
-                # BUG FIX: Previously only set resume_text (dict), but _sync_from_nested_objects()
-                # overwrites resume_text from resume_text_data during save(). So the extracted
-                # text was always lost. Must update resume_text_data which is the source of truth.
-                user_profile.resume_text = text  # Plain string for DB column
-                user_profile.resume_extracted_at = datetime.utcnow()
-                user_profile.resume_extraction_method = f"{extraction_method} (conversational_upload)"
-                # Also update the nested data object so _sync_from_nested_objects doesn't overwrite
-                if hasattr(user_profile, 'resume_text_data') and user_profile.resume_text_data:
-                    user_profile.resume_text_data.text = text
-                    user_profile.resume_text_data.extracted_at = datetime.utcnow()
-                    user_profile.resume_text_data.extraction_method = f"{extraction_method} (conversational_upload)"
-                user_profile.processing_status = 'completed'
-                user_profile.persona_status = 'pending'
-                user_profile.save()
-
-                logger.info(f"Successfully processed resume for user {user_id}. Extracted {len(text)} characters.")
-
+            # Identical re-upload whose text is still the one on the profile:
+            # nothing to re-parse
+            from app.utils.cache import cache
+            if user_profile.resume_text and cache.get_resume_hash(user_id) == _resume_fingerprint(
+                content_hash, user_profile.resume_text
+            ):
+                logger.info(f"Resume for user {user_id} unchanged since last upload - skipping extraction")
+                if user_profile.processing_status != 'completed':
+                    user_profile.processing_status = 'completed'
+                    user_profile.save()
                 return {
                     "success": True,
-                    "skipped": False,
-                    "reason": "Resume processed successfully",
-                    "message": f"Resume processed - extracted {len(text)} characters from {filename}"
+                    "skipped": True,
+                    "reason": "unchanged",
+                    "message": f"Resume unchanged - reusing previously extracted text for {filename}"
                 }
 
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            # Transient status for the UI - single-column update, not a full row save
+            UserProfile.update_processing_status(user_id, 'processing')
+
+            # Extract text straight from memory
+            text, extraction_method = _extract_text(content, suffix)
+
+            # Clean up the text
+            text = self._cleanup_text(text)
+
+            if not text:
+                raise ValueError("No text extracted from the resume")
+
+            self._store_resume_text(user_profile, text, f"{extraction_method} (conversational_upload)")
+            user_profile.processing_status = 'completed'
+            user_profile.persona_status = 'pending'
+            user_profile.save()
+            cache.set_resume_hash(user_id, _resume_fingerprint(content_hash, text))
+
+            logger.info(f"Successfully processed resume for user {user_id}. Extracted {len(text)} characters.")
+
+            return {
+                "success": True,
+                "skipped": False,
+                "reason": "Resume processed successfully",
+                "message": f"Resume processed - extracted {len(text)} characters from {filename}"
+            }
 
-        except base64.binascii.Error as e:
+        except (base64.binascii.Error, UnicodeEncodeError) as e:
             logger.error(f"Invalid base64 content for user {user_id}: {e}")
             return {
                 "success": False,
@@ -341,12 +499,7 @@ class ResumeService:
             }
         except ValueError as e:
             logger.error(f"Resume parsing failed for user {user_id}: {e}")
-            try:
-                user_profile = UserProfile.get(user_id)
-                user_profile.processing_status = 'failed_parsing'
-                user_profile.save()
-            except Exception:
-                pass
+            self._mark_failed(user_id, 'failed_parsing')
             return {
                 "success": False,
                 "skipped": False,
@@ -355,12 +508,7 @@ class ResumeService:
             }
         except Exception as e:
             logger.exception(f"Unexpected error processing base64 resume for {user_id}: {e}")
-            try:
-                user_profile = UserProfile.get(user_id)
-                user_profile.processing_status = 'failed_unknown'
-                user_profile.save()
-            except Exception:
-                pass
+            self._mark_failed(user_id, 'failed_unknown')
             return {
                 "success": False,
                 "skipped": False,
@@ -430,23 +578,24 @@ class ResumeService:
 
         try:
             user_profile = UserProfile.get(user_id)
-            user_profile.processing_status = 'processing'
-            user_profile.save()
+            # Transient status for the UI - single-column update, not a full row save
+            UserProfile.update_processing_status(user_id, 'processing')
 
             # Download the resume with SSRF protection
             logger.info(f"Downloading resume for user {user_id}...")
-            local_mode = os.getenv("LOCAL_MODE", "")
             backend_url = os.getenv("RECIPROCITY_BACKEND_URL", "")
 
-            if backend_url and not local_mode:
+            if backend_url and not LOCAL_MODE:
                 # Use backend proxy for downloads (safest option)
                 webhook_key = os.getenv("WEBHOOK_API_KEY", "")
                 stream_url = f"{backend_url}/api/v1/webhooks/stream-file"
                 headers = {"x-api-key": webhook_key} if webhook_key else {}
-                # Backend handles URL validation
+                # Backend handles URL validation. Never probed for Range
+                # support: each request would re-fetch through the proxy.
                 content = self._download_with_size_limit(
                     f"{stream_url}?url={requests.utils.quote(resume_link, safe='')}",
-                    headers
+                    headers,
+                    multistream=False
                 )
             else:
                 # Direct download - check domain allowlist (SSRF protection)
@@ -460,66 +609,30 @@ class ResumeService:
                     }
                 content = self._download_with_size_limit(resume_link)
 
-            # Determine file type and save to temp file
+            # Determine file type and extract text straight from memory
             suffix = self._get_file_extension(resume_link)
-            temp_path = self._save_upload_to_temp(content, suffix)
-            
-            try:
-                # Extract text using appropriate LangChain loader
-                logger.info(f"Extracting text from resume for user {user_id}...")
-                text = ""
-
-                if suffix in (".pdf",):
-                    loader = PyPDFLoader(temp_path)
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                    extraction_method = "PyPDFLoader"
-                elif suffix in (".docx",):
-                    loader = Docx2txtLoader(temp_path)
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                    extraction_method = "Docx2txtLoader"
-                elif suffix in (".txt", ".text"):
-                    loader = TextLoader(temp_path, encoding="utf-8")
-                    docs = loader.load()
-                    text = "\n\n".join(d.page_content for d in docs)
-                    extraction_method = "TextLoader"
-                else:
-                    raise ValueError(f"Unsupported file type: {suffix}")
-
-                # Clean up the text
-                text = self._cleanup_text(text)
-
-                if not text:
-                    raise ValueError("No text extracted from the resume.")
-
-                # Store extracted text — update BOTH resume_text and resume_text_data
-                # BUG FIX: Same fix as base64 path — must update resume_text_data
-                # so _sync_from_nested_objects() doesn't overwrite with None during save()
-                user_profile.resume_text = text  # Plain string for DB column
-                user_profile.resume_extracted_at = datetime.utcnow()
-                user_profile.resume_extraction_method = extraction_method
-                if hasattr(user_profile, 'resume_text_data') and user_profile.resume_text_data:
-                    user_profile.resume_text_data.text = text
-                    user_profile.resume_text_data.extracted_at = datetime.utcnow()
-                    user_profile.resume_text_data.extraction_method = extraction_method
-                user_profile.processing_status = 'completed'
-                user_profile.persona_status = 'pending'
-                user_profile.save()
+            logger.info(f"Extracting text from resume for user {user_id}...")
+            text, extraction_method = _extract_text(content, suffix)
 
-                logger.info(f"Successfully processed resume for user {user_id}. Extracted {len(text)} characters.")
-                
-                return {
-                    "success": True,
-                    "skipped": False,
-                    "reason": "Resume processed successfully",
-                    "message": f"Resume processed successfully - extracted {len(text)} characters"
-                }
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            # Clean up the text
+            text = self._cleanup_text(text)
+
+            if not text:
+                raise ValueError("No text extracted from the resume.")
+
+            self._store_resume_text(user_profile, text, extraction_method)
+            user_profile.processing_status = 'completed'
+            user_profile.persona_status = 'pending'
+            user_profile.save()
+
+            logger.info(f"Successfully processed resume for user {user_id}. Extracted {len(text)} characters.")
+            
+            return {
+                "success": True,
+                "skipped": False,
+                "reason": "Resume processed successfully",
+                "message": f"Resume processed successfully - extracted {len(text)} characters"
+            }
             
         except UserProfile.DoesNotExist:
             logger.warning(f"User profile {user_id} not found for resume processing.")
@@ -531,12 +644,7 @@ class ResumeService:
             }
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to download resume for user {user_id}: {e}")
-            try:
-                user_profile = UserProfile.get(user_id)
-                user_profile.processing_status = 'failed_download'
-                user_profile.save()
-            except Exception:
-                pass
+            self._mark_failed(user_id, 'failed_download')
             return {
                 "success": False,
                 "skipped": False,
@@ -545,12 +653,7 @@ class ResumeService:
             }
         except ValueError as e:
             logger.error(f"Resume parsing failed for user {user_id}: {e}")
-            try:
-                user_profile = UserProfile.get(user_id)
-                user_profile.processing_status = 'failed_parsing'
-                user_profile.save()
-            except Exception:
-                pass
+            self._mark_failed(user_id, 'failed_parsing')
             return {
                 "success": False,
                 "skipped": False,
@@ -559,12 +662,7 @@ class ResumeService:
             }
         except Exception as e:
             logger.exception(f"An unexpected error occurred during resume processing for user {user_id}: {e}")
-            try:
-                user_profile = UserProfile.get(user_id)
-                user_profile.processing_status = 'failed_unknown'
-                user_profile.save()
-            except Exception:
-                pass
+            self._mark_failed(user_id, 'failed_unknown')
             return {
                 "success": False,
                 "skipped": False,
@@ -14,11 +14,13 @@ Key features:
 """
 import os
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import ClassVar, Deque, Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
+from functools import lru_cache
+from uuid import uuid4
 
 from app.services.slot_extraction import SlotDefinition, SlotStatus, SlotSchema
 from app.services.context_manager import (
@@ -44,7 +46,7 @@ class ImpactLevel(str, Enum):
     HIGH = "high"          # 6+ or critical slots affected
 
 
-@dataclass
+@dataclass(slots=True)
 class EditOperation:
     """Represents a single edit operation."""
     edit_id: str
@@ -57,7 +59,7 @@ class EditOperation:
     applied: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EditImpactAnalysis:
     """Analysis of edit impact before applying."""
     slot_name: str
@@ -71,13 +73,15 @@ class EditImpactAnalysis:
     can_proceed: bool = True
 
 
-@dataclass
-class DependencyNode:
-    """Node in the dependency graph."""
-    slot_name: str
-    depends_on: Set[str] = field(default_factory=set)
-    depended_by: Set[str] = field(default_factory=set)
-    is_critical: bool = False
+@lru_cache(maxsize=1)
+def _graph_slot_defs() -> Dict[str, SlotDefinition]:
+    """Slot definitions covered by the dependency graph, keyed by name (last wins)."""
+    all_slots = {}
+    for slot_list in [SlotSchema.CORE_SLOTS, SlotSchema.INVESTOR_SLOTS,
+                      SlotSchema.FOUNDER_SLOTS, SlotSchema.OPTIONAL_SLOTS]:
+        for slot_def in slot_list:
+            all_slots[slot_def.name] = slot_def
+    return all_slots
 
 
 class DependencyGraph:
@@ -88,56 +92,102 @@ class DependencyGraph:
     upstream dependencies and downstream dependents.
     """
 
+    _instance: ClassVar[Optional["DependencyGraph"]] = None
+
     def __init__(self):
-        self.nodes: Dict[str, DependencyNode] = {}
+        self._depends_on: Dict[str, FrozenSet[str]] = {}
+        self._depended_by: Dict[str, FrozenSet[str]] = {}
+        self._is_critical: FrozenSet[str] = frozenset()
+        self._trans_dependents: Dict[str, FrozenSet[str]] = {}
+        self._trans_dependencies: Dict[str, FrozenSet[str]] = {}
+        self._cyclic_slots: FrozenSet[str] = frozenset()
+        self._dependent_count: Dict[str, int] = {}
         self._build_graph()
 
+    @classmethod
+    def instance(cls) -> "DependencyGraph":
+        """Get the shared graph; the slot schema never changes at runtime."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def _build_graph(self) -> None:
         """Build dependency graph from slot schema."""
-        schema = SlotSchema()
-
-        # Collect all slot definitions (convert lists to dict keyed by name)
-        all_slots = {}
-        for slot_list in [schema.CORE_SLOTS, schema.INVESTOR_SLOTS,
-                          schema.FOUNDER_SLOTS, schema.OPTIONAL_SLOTS]:
-            for slot_def in slot_list:
-                all_slots[slot_def.name] = slot_def
-
-        # Create nodes
-        for slot_name, slot_def in all_slots.items():
-            node = DependencyNode(
-                slot_name=slot_name,
-                is_critical=slot_def.required
-            )
+        all_slots = _graph_slot_defs()
+
+        # Adjacency in both directions, mutable while the graph is built
+        depends_on = {name: set(slot_def.depends_on or ()) for name, slot_def in all_slots.items()}
+        depended_by = {name: set() for name in all_slots}
+        for slot_name, deps in depends_on.items():
+            for dep in deps:
+                if dep in depended_by:
+                    depended_by[dep].add(slot_name)
 
-            # Add dependencies
-            if slot_def.depends_on:
-                node.depends_on = set(slot_def.depends_on)
+        # Add implicit dependencies
+        self._add_implicit_dependencies(depends_on, depended_by)
 
-            self.nodes[slot_name] = node
+        self._depends_on = {name: frozenset(deps) for name, deps in depends_on.items()}
+        self._depended_by = {name: frozenset(deps) for name, deps in depended_by.items()}
+        self._is_critical = frozenset(
+            name for name, slot_def in all_slots.items() if slot_def.required
+        )
 
-        # Build reverse dependencies (depended_by)
-        for slot_name, node in self.nodes.items():
-            for dep in node.depends_on:
-                if dep in self.nodes:
-                    self.nodes[dep].depended_by.add(slot_name)
+        # The schema is static, so resolve transitive lookups once up front
+        self._trans_dependents = self._transitive_closure(self._depended_by)
+        self._trans_dependencies = self._transitive_closure(self._depends_on)
+        self._dependent_count = {
+            name: len(dependents) for name, dependents in self._trans_dependents.items()
+        }
 
-        # Add implicit dependencies
-        self._add_implicit_dependencies()
+        # A slot is on a cycle if it reaches itself; anything depending on
+        # such a slot inherits the cycle
+        on_cycle = {name for name, deps in self._trans_dependencies.items() if name in deps}
+        self._cyclic_slots = frozenset(
+            name for name, deps in self._trans_dependencies.items()
+            if name in on_cycle or not on_cycle.isdisjoint(deps)
+        )
 
-    def _add_implicit_dependencies(self) -> None:
+    @staticmethod
+    def _add_implicit_dependencies(
+        depends_on: Dict[str, Set[str]],
+        depended_by: Dict[str, Set[str]]
+    ) -> None:
         """Add implicit dependencies not in schema."""
         # user_type determines which role-specific slots are relevant
-        if "user_type" in self.nodes:
+        if "user_type" in depends_on:
             investor_slots = ["check_size", "portfolio_size", "investment_thesis"]
             founder_slots = ["company_stage", "funding_need", "team_size"]
 
             for slot in investor_slots + founder_slots:
-                if slot in self.nodes:
-                    self.nodes[slot].depends_on.add("user_type")
-                    self.nodes["user_type"].depended_by.add(slot)
-
-    def get_dependents(self, slot_name: str, recursive: bool = True) -> Set[str]:
+                if slot in depends_on:
+                    depends_on[slot].add("user_type")
+                    depended_by["user_type"].add(slot)
+
+    @staticmethod
+    def _transitive_closure(edges: Dict[str, FrozenSet[str]]) -> Dict[str, FrozenSet[str]]:
+        """Walk ``edges`` from every node and freeze the reachable set."""
+        closure = {}
+        for slot_name, direct in edges.items():
+            reached = set(direct)
+            to_check = list(reached)
+            while to_check:
+                current = to_check.pop()
+                if current in edges:
+                    new_nodes = edges[current] - reached
+                    reached.update(new_nodes)
+                    to_check.extend(new_nodes)
+            closure[slot_name] = frozenset(reached)
+        return closure
+
+    def is_critical(self, slot_name: str) -> bool:
+        """Check if slot is required for matching."""
+        return slot_name in self._is_critical
+
+    def dependent_count(self, slot_name: str) -> int:
+        """Number of slots that depend on the given slot, transitively."""
+        return self._dependent_count.get(slot_name, 0)
+
+    def get_dependents(self, slot_name: str, recursive: bool = True) -> FrozenSet[str]:
         """
         Get all slots that depend on the given slot.
 
@@ -146,25 +196,13 @@ class DependencyGraph:
             recursive: Whether to include transitive dependents
 
         Returns:
-            Set of dependent slot names
+            Frozen set of dependent slot names
         """
-        if slot_name not in self.nodes:
-            return set()
-
-        dependents = set(self.nodes[slot_name].depended_by)
-
         if recursive:
-            to_check = list(dependents)
-            while to_check:
-                current = to_check.pop()
-                if current in self.nodes:
-                    new_deps = self.nodes[current].depended_by - dependents
-                    dependents.update(new_deps)
-                    to_check.extend(new_deps)
-
-        return dependents
+            return self._trans_dependents.get(slot_name, frozenset())
+        return self._depended_by.get(slot_name, frozenset())
 
-    def get_dependencies(self, slot_name: str, recursive: bool = True) -> Set[str]:
+    def get_dependencies(self, slot_name: str, recursive: bool = True) -> FrozenSet[str]:
         """
         Get all slots that the given slot depends on.
 
@@ -173,23 +211,11 @@ class DependencyGraph:
             recursive: Whether to include transitive dependencies
 
         Returns:
-            Set of dependency slot names
+            Frozen set of dependency slot names
         """
-        if slot_name not in self.nodes:
-            return set()
-
-        dependencies = set(self.nodes[slot_name].depends_on)
-
         if recursive:
-            to_check = list(dependencies)
-            while to_check:
-                current = to_check.pop()
-                if current in self.nodes:
-                    new_deps = self.nodes[current].depends_on - dependencies
-                    dependencies.update(new_deps)
-                    to_check.extend(new_deps)
-
-        return dependencies
+            return self._trans_dependencies.get(slot_name, frozenset())
+        return self._depends_on.get(slot_name, frozenset())
 
     def get_critical_path(self, slot_name: str) -> List[str]:
         """
@@ -199,47 +225,32 @@ class DependencyGraph:
         """
         dependencies = self.get_dependencies(slot_name)
 
-        # Topological sort
+        # Kahn's algorithm over the subgraph induced by the dependencies
+        in_degree = {
+            dep: len(self._depends_on.get(dep, frozenset()) & dependencies)
+            for dep in dependencies
+        }
+        ready = deque(sorted(dep for dep, degree in in_degree.items() if degree == 0))
         result = []
-        visited = set()
-
-        def visit(node: str):
-            if node in visited:
-                return
-            visited.add(node)
-            if node in self.nodes:
-                for dep in self.nodes[node].depends_on:
-                    visit(dep)
+
+        while ready:
+            node = ready.popleft()
             result.append(node)
+            for dependent in sorted(self._depended_by.get(node, frozenset()) & dependencies):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
 
-        for dep in dependencies:
-            visit(dep)
+        # Slots on a cycle never reach zero in-degree; keep them at the end
+        if len(result) < len(dependencies):
+            emitted = set(result)
+            result.extend(sorted(dep for dep in dependencies if dep not in emitted))
 
         return result
 
     def has_circular_dependency(self, slot_name: str) -> bool:
         """Check if slot has circular dependencies."""
-        visited = set()
-        path = set()
-
-        def dfs(node: str) -> bool:
-            if node in path:
-                return True
-            if node in visited:
-                return False
-
-            visited.add(node)
-            path.add(node)
-
-            if node in self.nodes:
-                for dep in self.nodes[node].depends_on:
-                    if dfs(dep):
-                        return True
-
-            path.remove(node)
-            return False
-
-        return dfs(slot_name)
+        return slot_name in self._cyclic_slots
 
 
 class SmartEdit:
@@ -252,15 +263,17 @@ class SmartEdit:
 
     def __init__(self, context_manager: Optional[ContextManager] = None):
         self.context_manager = context_manager or ContextManager()
-        self.graph = DependencyGraph()
-
-        # Edit history per session for undo/redo
-        self._edit_history: Dict[str, List[EditOperation]] = defaultdict(list)
-        self._redo_stack: Dict[str, List[EditOperation]] = defaultdict(list)
+        self.graph = DependencyGraph.instance()
 
         # Configuration
         self.max_history_size = int(os.getenv("EDIT_HISTORY_SIZE", "20"))
 
+        # Edit history per session for undo/redo (bounded; oldest edits drop off)
+        self._edit_history: Dict[str, Deque[EditOperation]] = defaultdict(
+            lambda: deque(maxlen=self.max_history_size)
+        )
+        self._redo_stack: Dict[str, List[EditOperation]] = defaultdict(list)
+
     def analyze_edit(
         self,
         session_id: str,
@@ -294,6 +307,25 @@ class SmartEdit:
                 can_proceed=False
             )
 
+        # Leaf slots cannot cascade; only the critical/cycle warnings apply
+        if not self.graph.dependent_count(slot_name):
+            warnings = []
+            if self.graph.is_critical(slot_name):
+                warnings.append(f"'{slot_name}' is a critical slot that affects matching.")
+            if self.graph.has_circular_dependency(slot_name):
+                warnings.append("Warning: Circular dependency detected.")
+            return EditImpactAnalysis(
+                slot_name=slot_name,
+                edit_type=edit_type,
+                new_value=new_value,
+                impact_level=ImpactLevel.NONE,
+                affected_slots=[],
+                will_invalidate=[],
+                requires_re_prompt=[],
+                warnings=warnings,
+                can_proceed=True
+            )
+
         # Get all dependent slots
         dependents = self.graph.get_dependents(slot_name)
         affected = list(dependents)
@@ -322,7 +354,7 @@ class SmartEdit:
         warnings = []
 
         # Check for critical slot edits
-        if slot_name in self.graph.nodes and self.graph.nodes[slot_name].is_critical:
+        if self.graph.is_critical(slot_name):
             warnings.append(f"'{slot_name}' is a critical slot that affects matching.")
 
         # Check for major impact
@@ -401,7 +433,7 @@ class SmartEdit:
 
         # Create edit operation
         edit_op = EditOperation(
-            edit_id=f"{session_id}_{datetime.utcnow().timestamp()}",
+            edit_id=str(uuid4()),
             slot_name=slot_name,
             edit_type=edit_type,
             old_value=old_value,
@@ -513,11 +545,7 @@ class SmartEdit:
 
     def _add_to_history(self, session_id: str, edit_op: EditOperation) -> None:
         """Add edit to history, maintaining size limit."""
-        history = self._edit_history[session_id]
-        history.append(edit_op)
-
-        if len(history) > self.max_history_size:
-            self._edit_history[session_id] = history[-self.max_history_size:]
+        self._edit_history[session_id].append(edit_op)
 
     def undo(self, session_id: str) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -624,13 +652,12 @@ class SmartEdit:
         for slot_name, slot in context.slots.items():
             # All filled/confirmed slots are editable
             if slot.status in [SlotStatus.FILLED, SlotStatus.CONFIRMED, SlotStatus.PARTIAL]:
-                node = self.graph.nodes.get(slot_name)
                 editable.append({
                     "slot_name": slot_name,
                     "current_value": slot.value,
                     "status": slot.status.value,
-                    "is_critical": node.is_critical if node else False,
-                    "dependent_count": len(self.graph.get_dependents(slot_name))
+                    "is_critical": self.graph.is_critical(slot_name),
+                    "dependent_count": self.graph.dependent_count(slot_name)
                 })
 
         return editable
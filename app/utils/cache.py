@@ -19,6 +19,7 @@ REDIS_URL = os.getenv('REDIS_URL', os.getenv('CELERY_BROKER_URL', 'redis://local
 CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
 CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', '86400'))  # 24 hours default
 EMBEDDING_CACHE_TTL = int(os.getenv('EMBEDDING_CACHE_TTL', '604800'))  # 7 days for embeddings
+RESUME_HASH_CACHE_TTL = int(os.getenv('RESUME_HASH_CACHE_TTL', '2592000'))  # 30 days for resume hashes
 
 
 class RedisCache:
@@ -143,6 +144,14 @@ class RedisCache:
         key = f"persona:{user_id}"
         return self.set(key, persona, ttl)
 
+    def get_resume_hash(self, user_id: str) -> Optional[str]:
+        """Get the fingerprint (content hash + stored text hash) of the user's last extracted resume."""
+        return self.get(f"cv_hash:{user_id}")
+
+    def set_resume_hash(self, user_id: str, fingerprint: str, ttl: int = RESUME_HASH_CACHE_TTL) -> bool:
+        """Record the fingerprint of the user's extracted resume."""
+        return self.set(f"cv_hash:{user_id}", fingerprint, ttl)
+
     def invalidate_user(self, user_id: str) -> int:
         """
         Invalidate all cache entries for a user.
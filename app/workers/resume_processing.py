@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 @celery_app.task(bind=True, name='process_resume')
 def process_resume_task(self, user_id: str, resume_link: Optional[str]):
     """
-    Background task to process resume using LangChain loaders and store parsed text.
+    Background task to extract resume text and store it on the user profile.
     After completion, notifies pipeline orchestrator.
     """
     try:
@@ -0,0 +1,13 @@
+-- Migration: Compress user_profiles.resume_text with LZ4
+-- Date: 2026-10-17
+--
+-- Switches the TOAST compression codec for new resume_text values from the
+-- default pglz to LZ4, which compresses and decompresses faster. Values are
+-- still plain TEXT to the application; readers are unchanged.
+--
+-- Requires Postgres 14+ built with LZ4 (Supabase is). This migration does
+-- not rewrite existing rows: values already stored keep pglz, and only
+-- values written after it runs use LZ4.
+
+ALTER TABLE user_profiles
+ALTER COLUMN resume_text SET COMPRESSION lz4;
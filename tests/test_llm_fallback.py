@@ -0,0 +1,42 @@
+"""
+Unit tests for the cross-provider LLM fallback utility.
+"""
+import pytest
+from unittest.mock import Mock, patch
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import llm_fallback
+
+
+class TestOpenAITokenParam:
+    """Tests for upfront max_tokens / max_completion_tokens selection."""
+
+    @pytest.mark.parametrize("model,expected", [
+        ("gpt-5.4", "max_completion_tokens"),
+        ("gpt-4.1-mini", "max_completion_tokens"),
+        ("o3-mini", "max_completion_tokens"),
+        ("gpt-4o", "max_tokens"),
+        ("gpt-3.5-turbo", "max_tokens"),
+    ])
+    def test_param_by_model(self, model, expected):
+        """The parameter name should follow the model family."""
+        assert llm_fallback._openai_token_param(model) == expected
+
+    def test_openai_call_sends_single_request(self):
+        """The fallback call should use the right parameter on the first try."""
+        client = Mock()
+        client.chat.completions.create.return_value.choices = [Mock(message=Mock(content="ok"))]
+        with patch.object(llm_fallback, "_get_openai_client", return_value=client):
+            result = llm_fallback._call_openai_full(
+                "system", [{"role": "user", "content": "hi"}], max_tokens=50, model="gpt-5.4"
+            )
+
+        assert result == "ok"
+        kwargs = client.chat.completions.create.call_args.kwargs
+        assert kwargs["max_completion_tokens"] == 50
+        assert "max_tokens" not in kwargs
+        assert client.chat.completions.create.call_count == 1
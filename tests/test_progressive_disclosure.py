@@ -0,0 +1,83 @@
+"""
+Unit tests for ProgressiveDisclosure.
+Tests engagement classification and phase transition batches.
+"""
+import pytest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.progressive_disclosure import EngagementMetrics, UserEngagementLevel
+
+
+def _reference_engagement_level(metrics: EngagementMetrics) -> UserEngagementLevel:
+    """Original branch-based classifier, kept to check lookup-table parity."""
+    if metrics.questions_answered == 0 and metrics.questions_skipped == 0:
+        return UserEngagementLevel.MODERATE
+    if metrics.avg_response_length > 100 and metrics.questions_skipped == 0:
+        return UserEngagementLevel.HIGH
+    skip_rate = (metrics.questions_skipped /
+                 max(1, metrics.questions_answered + metrics.questions_skipped))
+    if skip_rate > 0.3 or metrics.avg_response_length < 10:
+        if metrics.avg_response_time_seconds < 5:
+            return UserEngagementLevel.FRUSTRATED
+        return UserEngagementLevel.LOW
+    return UserEngagementLevel.MODERATE
+
+
+class TestEngagementLevel:
+    """Tests for the bucketed engagement lookup."""
+
+    def test_no_data_is_moderate(self):
+        """Default metrics should not be classified as frustrated."""
+        assert EngagementMetrics().get_engagement_level() == UserEngagementLevel.MODERATE
+
+    @pytest.mark.parametrize("length", [0.0, 5.0, 9.99, 10.0, 50.0, 100.0, 100.01, 250.0])
+    @pytest.mark.parametrize("time_seconds", [0.0, 4.99, 5.0, 30.0])
+    @pytest.mark.parametrize("answered,skipped", [
+        (1, 0), (10, 0), (0, 1), (7, 3), (6, 4), (9, 1), (2, 1), (100, 42), (70, 30),
+    ])
+    def test_matches_reference_classifier(self, length, time_seconds, answered, skipped):
+        """Lookup table should agree with the original comparisons everywhere."""
+        metrics = EngagementMetrics(
+            avg_response_length=length,
+            avg_response_time_seconds=time_seconds,
+            questions_answered=answered,
+            questions_skipped=skipped,
+        )
+        assert metrics.get_engagement_level() == _reference_engagement_level(metrics)
+
+
+class TestPhaseTransitionBatch:
+    """Tests for the per-phase transition batches."""
+
+    @pytest.fixture
+    def disclosure(self):
+        from app.services.progressive_disclosure import ProgressiveDisclosure
+        return ProgressiveDisclosure()
+
+    def test_transition_batch_not_shared(self, disclosure):
+        """Repeated polls should get independent batches with the phase's id."""
+        from app.services.context_manager import ConversationPhase
+        context = disclosure.context_manager.create_session("user-1")
+        context.phase = ConversationPhase.CONFIRMATION
+
+        first = disclosure._create_phase_transition_batch(context)
+        second = disclosure._create_phase_transition_batch(context)
+
+        assert first is not second
+        first.questions.append("leaked")
+        assert second.questions == []
+        assert first.batch_id == "transition_confirmation"
+        assert first.phase == ConversationPhase.CONFIRMATION
+        assert first.can_skip_batch is True
+
+    def test_transition_batch_refreshes_progress(self, disclosure):
+        """Progress fields should reflect the context on every call."""
+        context = disclosure.context_manager.create_session("user-2")
+        batch = disclosure._create_phase_transition_batch(context)
+
+        assert batch.progress_percent == disclosure._calculate_progress(context)
+        assert batch.estimated_remaining_minutes == disclosure._estimate_remaining_time(context)
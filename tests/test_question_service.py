@@ -0,0 +1,496 @@
+"""
+Unit tests for QuestionService.
+Tests prompt construction, response caching and output cleanup.
+"""
+import pytest
+import asyncio
+from unittest.mock import Mock, patch, AsyncMock
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _fake_response(text):
+    """Build a minimal Anthropic messages.create response."""
+    response = Mock()
+    response.content = [Mock(text=text)]
+    return response
+
+
+@pytest.fixture
+def service():
+    """Create QuestionService with mocked Anthropic clients."""
+    with patch.dict(os.environ, {'ANTHROPIC_CHAT_KEY': 'test-key'}):
+        with patch('app.services.question_service.Anthropic'), \
+             patch('app.services.question_service.AsyncAnthropic'):
+            from app.services import question_service
+            question_service._get_anthropic_client.cache_clear()
+            question_service._get_async_anthropic_client.cache_clear()
+            svc = question_service.QuestionService()
+    svc.client.messages.create = Mock(return_value=_fake_response("What's your goal?"))
+    svc.async_client.messages.create = AsyncMock(return_value=_fake_response("What's your goal?"))
+    return svc
+
+
+class TestSharedClients:
+    """Tests for process-wide client reuse."""
+
+    def test_instances_share_clients(self, service):
+        """A second service instance should reuse the same clients."""
+        from app.services.question_service import QuestionService
+        with patch.dict(os.environ, {'ANTHROPIC_CHAT_KEY': 'test-key'}):
+            other = QuestionService()
+        assert other.client is service.client
+        assert other.async_client is service.async_client
+
+    def test_sdk_retries_disabled(self):
+        """Clients should leave retries to _retry_transient."""
+        from app.services import question_service
+        assert question_service._get_anthropic_client('retry-key').max_retries == 0
+        assert question_service._get_async_anthropic_client('retry-key').max_retries == 0
+
+
+class TestQuestionServiceCache:
+    """Tests for the exact-match response cache."""
+
+    def test_repeat_rewrite_served_from_cache(self, service):
+        """Identical rewrite requests should only hit the API once."""
+        prompt = "What is your primary goal for joining the platform right now?"
+        first = service.modify_question_tone(prompt, options=["Invest", "Raise"])
+        second = service.modify_question_tone(prompt, options=["Invest", "Raise"])
+
+        assert first == second == "What's your goal?"
+        assert service.client.messages.create.call_count == 1
+        assert service._cache_hits == 1
+
+    def test_different_inputs_not_shared(self, service):
+        """A different user message must not reuse a cached response."""
+        service.modify_question_tone("Next?", user_message="I invest", context="AI: Hi\nUser: I invest")
+        service.modify_question_tone("Next?", user_message="I raise", context="AI: Hi\nUser: I raise")
+
+        assert service.client.messages.create.call_count == 2
+
+    def test_async_and_sync_share_cache(self, service):
+        """Async calls should reuse responses cached by sync calls."""
+        service.generate_followup_question("What's your goal?", "What is your goal?")
+        result = asyncio.run(
+            service.generate_followup_question_async("What's your goal?", "What is your goal?")
+        )
+
+        assert result == "What's your goal?"
+        service.async_client.messages.create.assert_not_called()
+
+
+class TestQuestionServicePrompts:
+    """Tests for static-prefix prompt construction."""
+
+    def test_dynamic_fields_after_static_instructions(self, service):
+        """Context and user message should follow the fixed scaffolding."""
+        from app.services.question_service import ACKNOWLEDGE_INSTRUCTIONS, SYSTEM_PROMPT_FULL
+        system_prompt, user_prompt = service._build_tone_prompts(
+            "Which stage?", user_message="Seed", context="AI: Stage?\nUser: Seed"
+        )
+
+        assert system_prompt == SYSTEM_PROMPT_FULL
+        assert user_prompt.startswith(ACKNOWLEDGE_INSTRUCTIONS)
+        assert user_prompt.index("Previous conversation:") > len(ACKNOWLEDGE_INSTRUCTIONS)
+
+
+class TestQuestionServiceBatch:
+    """Tests for batched first-call rewrites."""
+
+    def test_batch_uses_single_request(self, service):
+        """All uncached prompts should be rewritten in one API call."""
+        service.client.messages.create.return_value = _fake_response(
+            '{"questions": ["Sure! What brings you here?", "Which stage are you at?"]}'
+        )
+        results = service.modify_questions_batch(
+            ["Goal?", "Which funding stage is your company currently at, roughly?"],
+            [None, ["Seed", "Series A"]]
+        )
+
+        assert results == ["What brings you here?", "Which stage are you at?"]
+        assert service.client.messages.create.call_count == 1
+        # Individual results are cached for later single-question calls
+        assert service.modify_question_tone("Goal?") == "What brings you here?"
+        assert service.client.messages.create.call_count == 1
+
+    def test_batch_prompt_asks_only_for_json(self, service):
+        """The batch prompt should not carry single-question output rules and should keep per-item options."""
+        from app.services import question_service
+        _, _, pending, batch_prompt = service._prepare_rewrite_batch(
+            ["Goal?", "Stage?"], [None, ["Seed", "Series A"]]
+        )
+
+        assert pending == [0, 1]
+        assert batch_prompt.startswith(question_service.BATCH_REWRITE_INSTRUCTIONS)
+        assert "ONLY the question text" not in batch_prompt
+        assert batch_prompt.endswith(
+            "1. Goal?\n\n2. Stage?" + question_service._OPTIONS_HDR
+            + "- Seed\n- Series A" + question_service._OPTIONS_FTR
+        )
+
+        service.client.messages.create.return_value = _fake_response('{"questions": ["A?", "B?"]}')
+        service.modify_questions_batch(["Goal?", "Stage?"])
+        system = service.client.messages.create.call_args.kwargs["system"]
+        assert "ONLY the question text" not in str(system)
+
+    def test_batch_falls_back_on_bad_json(self, service):
+        """A malformed batch response should fall back to per-question calls."""
+        service.client.messages.create.side_effect = [
+            _fake_response("not json"),
+            _fake_response("One?"),
+            _fake_response("Two?"),
+        ]
+        results = service.modify_questions_batch(["First", "Second"])
+
+        assert results == ["One?", "Two?"]
+        assert service.client.messages.create.call_count == 3
+
+    def test_async_batch_parses_fenced_json(self, service):
+        """Code-fenced JSON from the model should still parse."""
+        service.async_client.messages.create.return_value = _fake_response(
+            '```json\n{"questions": ["A?"]}\n```'
+        )
+        assert asyncio.run(service.modify_questions_batch_async(["a"])) == ["A?"]
+
+
+class TestCleanIntroductoryText:
+    """Tests for stripping LLM meta-commentary from rewrites."""
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("Sure! What's your main goal?", "What's your main goal?"),
+        ("Absolutely! Here's what's your main goal?", "what's your main goal?"),
+        ("Of course! a friendlier and more engaging version\n---\nWhat's your goal?", "What's your goal?"),
+        ("Certainly!\n===\n\nWhat's your goal?", "What's your goal?"),
+        ("What's your main goal?", "What's your main goal?"),
+        ("---\n- Raise funding\n- Hire", "- Raise funding\n- Hire"),
+        ("", ""),
+    ])
+    def test_strips_intro_phrases(self, service, raw, expected):
+        """Intro phrases and leading separator lines should be removed."""
+        assert service._clean_introductory_text(raw) == expected
+
+
+class _FakeStream:
+    """Async context manager mimicking AsyncMessageStream.text_stream."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class TestQuestionServiceStream:
+    """Tests for streamed question rewrites."""
+
+    async def _collect(self, agen):
+        return [chunk async for chunk in agen]
+
+    def test_stream_strips_intro_from_buffered_prefix(self, service):
+        """Intro phrases should be removed before the first chunk is emitted."""
+        from app.services.question_service import STREAM_CLEANUP_BUFFER_CHARS
+        body = "What brings you here? " * (STREAM_CLEANUP_BUFFER_CHARS // 10)
+        chunks = ["Sure! ", "---\n"] + [body[i:i + 7] for i in range(0, len(body), 7)]
+        service.async_client.messages.stream = Mock(return_value=_FakeStream(chunks))
+
+        out = asyncio.run(self._collect(service.modify_question_tone_stream("Goal?")))
+
+        assert len(out) > 1
+        assert "".join(out) == body
+        # Full response is cached for non-streaming callers
+        assert service.modify_question_tone("Goal?") == body.rstrip()
+
+    def test_short_stream_flushed_at_end(self, service):
+        """Responses shorter than the buffer are still emitted once."""
+        service.async_client.messages.stream = Mock(return_value=_FakeStream(["Of course! ", "Ready?"]))
+
+        out = asyncio.run(self._collect(service.modify_question_tone_stream("Ready?")))
+
+        assert out == ["Ready?"]
+
+
+class TestFormatOptions:
+    """Tests for option formatting used in prompts."""
+
+    def test_formats_mixed_options(self, service):
+        """Dict labels, dict values and plain strings should all render."""
+        options = [{"label": "Angel", "value": "angel"}, {"value": "vc"}, "Other"]
+        assert service.format_options_for_prompt(options) == "- Angel\n- vc\n- Other"
+
+    def test_string_and_empty_options(self, service):
+        """Strings pass through stripped; empty inputs format to nothing."""
+        assert service.format_options_for_prompt("  A or B ") == "A or B"
+        assert service.format_options_for_prompt([]) == ""
+        assert service.format_options_for_prompt(None) == ""
+
+    def test_repeat_options_hit_memo(self, service):
+        """Identical option lists should reuse the memoized string."""
+        from app.services.question_service import _format_option_labels
+        _format_option_labels.cache_clear()
+        service.format_options_for_prompt(["Seed", "Series A"])
+        service.format_options_for_prompt(["Seed", "Series A"])
+        assert _format_option_labels.cache_info().hits == 1
+
+
+class TestQuestionServiceBatchApi:
+    """Tests for offline rewrites through the Message Batches API."""
+
+    def test_submit_uses_index_custom_ids(self, service):
+        """Each request should carry its prompt index as custom_id."""
+        service.client.messages.batches.create.return_value = Mock(id="msgbatch_1")
+
+        batch_id = service.submit_batch_rewrite(["Goal?", "Stage?"])
+
+        assert batch_id == "msgbatch_1"
+        requests = service.client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["0", "1"]
+        assert "Question: Stage?" in requests[1]["params"]["messages"][0]["content"]
+
+    def test_fetch_results_skips_failures(self, service):
+        """Errored entries are omitted and successes cleaned."""
+        ok = Mock(custom_id="1")
+        ok.result.type = "succeeded"
+        ok.result.message.content = [Mock(text="Sure! Which stage?")]
+        errored = Mock(custom_id="0")
+        errored.result.type = "errored"
+        service.client.messages.batches.results.return_value = iter([errored, ok])
+
+        assert service.fetch_batch_results("msgbatch_1") == {1: "Which stage?"}
+
+
+class TestBuildConversationContext:
+    """Tests for the AI/User transcript passed as context."""
+
+    def _turn(self, ai_text, user_response):
+        return Mock(ai_text=ai_text, user_response=user_response)
+
+    def test_skips_unanswered_turns(self, service):
+        """Turns without a user response are left out."""
+        turns = [self._turn("Goal?", "Raise"), self._turn("Stage?", None), self._turn("Where?", "NYC")]
+        assert service.build_conversation_context(turns) == "AI: Goal?\nUser: Raise\nAI: Where?\nUser: NYC"
+
+    def test_empty_history_returns_none(self, service):
+        """No history, or no answered turns, gives no context."""
+        assert service.build_conversation_context([]) is None
+        assert service.build_conversation_context([self._turn("Goal?", "")]) is None
+
+    def test_window_keeps_recent_turns(self, service):
+        """Older turns beyond the window are dropped when no summary is given."""
+        turns = [self._turn(f"Q{i}?", f"A{i}") for i in range(5)]
+        assert service.build_conversation_context(turns, window=2) == (
+            "AI: Q2?\nUser: A2\nAI: Q3?\nUser: A3\nAI: Q4?\nUser: A4"
+        )
+
+    def test_summary_prefixes_recent_turns(self, service):
+        """A summary replaces the older turns at the head of the context."""
+        turns = [self._turn(f"Q{i}?", f"A{i}") for i in range(4)]
+        context = service.build_conversation_context(turns, window=2, summary="User wants to raise.")
+        assert context == "Summary of earlier conversation: User wants to raise.\nAI: Q2?\nUser: A2\nAI: Q3?\nUser: A3"
+
+    def test_cutoff_advances_in_window_steps(self, service):
+        """The summarized prefix only changes every `window` turns."""
+        from app.services.question_service import QuestionService
+        assert [QuestionService._history_cutoff(n, 3) for n in range(10)] == [0, 0, 0, 0, 0, 0, 3, 3, 3, 6]
+
+    def test_summary_cached_until_cutoff_moves(self, service):
+        """Summaries are computed once per window step."""
+        service.client.messages.create.return_value = _fake_response("User wants to raise.")
+        turns = [self._turn(f"Q{i}?", f"A{i}") for i in range(4)]
+
+        assert service.summarize_history(turns, window=2) == "User wants to raise."
+        assert service.summarize_history(turns + [self._turn("Q4?", "A4")], window=2) == "User wants to raise."
+        assert service.client.messages.create.call_count == 1
+        assert service.summarize_history(turns[:2], window=2) is None
+
+    def test_cached_summary_never_calls_llm(self, service):
+        """The request-path lookup only reads summaries already in the cache."""
+        service.client.messages.create.return_value = _fake_response("User wants to raise.")
+        turns = [self._turn(f"Q{i}?", f"A{i}") for i in range(4)]
+
+        assert service.cached_history_summary(turns, window=2) is None
+        service.client.messages.create.assert_not_called()
+        service.summarize_history(turns, window=2)
+        assert service.cached_history_summary(turns, window=2) == "User wants to raise."
+
+    def test_request_path_defers_summary(self, service):
+        """Without a cached summary the route keeps full history and summarizes in the background."""
+        from fastapi import BackgroundTasks
+        from app.routers.question import _resolve_conversation
+        from app.schemas.question import QuestionPayload
+        history = [
+            {"question_id": f"q{i}", "ai_text": f"Q{i}?", "prompt": f"Q{i}?",
+             "suggestion_chips": "", "user_response": f"A{i}"}
+            for i in range(8)
+        ]
+        payload = QuestionPayload(
+            question_id="q1", code="Q001", prompt="Next?", suggestion_chips="chip",
+            previous_user_response=history
+        )
+        background_tasks = BackgroundTasks()
+
+        is_first_call, user_message, context = _resolve_conversation(payload, service, background_tasks)
+
+        assert not is_first_call and user_message == "A7"
+        assert context.startswith("AI: Q0?\nUser: A0")
+        service.client.messages.create.assert_not_called()
+        service.async_client.messages.create.assert_not_called()
+        assert [task.func for task in background_tasks.tasks] == [service.summarize_history_async]
+
+
+class TestChatHelper:
+    """Tests for the shared completion helper."""
+
+    def test_rate_limit_retried_without_fallback(self, service):
+        """Rate limits should be retried with backoff before falling back."""
+        import httpx
+        from anthropic import RateLimitError
+        from app.services.question_service import QuestionService
+        rate_limited = RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, request=httpx.Request("POST", "https://api.anthropic.com")),
+            body=None,
+        )
+        service.client.messages.create.side_effect = [rate_limited, _fake_response("  Hi?  ")]
+
+        with patch.object(QuestionService._create_message.retry, "sleep", lambda _: None), \
+             patch('app.services.llm_fallback.fallback_from_anthropic_error') as fallback:
+            assert service._chat("system", "user") == "Hi?"
+
+        assert service.client.messages.create.call_count == 2
+        fallback.assert_not_called()
+
+    def test_fallback_disabled_reraises(self, service):
+        """With fallback=False the provider error propagates."""
+        service.client.messages.create.side_effect = ValueError("bad request")
+        with pytest.raises(ValueError):
+            service._chat("system", "user", fallback=False)
+
+
+class TestParseRewriteBatch:
+    """Tests for validating batched rewrite payloads."""
+
+    @pytest.mark.parametrize("text", [
+        '{"questions": ["A?", 2]}',
+        '{"questions": "A?"}',
+        '{"items": ["A?"]}',
+        '["A?"]',
+        '{"questions": ["A?", "B?", "C?"]}',
+    ])
+    def test_rejects_malformed_payloads(self, text):
+        """Wrong shapes or counts should trigger the per-question fallback."""
+        from app.services.question_service import QuestionService
+        assert QuestionService._parse_rewrite_batch(text, 2) is None
+
+    def test_accepts_valid_payload(self):
+        """A list of the expected number of strings is returned as-is."""
+        from app.services.question_service import QuestionService
+        assert QuestionService._parse_rewrite_batch('{"questions": ["A?", "B?"]}', 2) == ["A?", "B?"]
+
+
+class TestConcurrencyLimit:
+    """Tests for the async in-flight request bound."""
+
+    def test_gathered_calls_respect_semaphore(self, service):
+        """No more than QUESTION_MAX_CONCURRENCY calls should run at once."""
+        from app.services import question_service
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _fake_response("Q?")
+
+        service.async_client.messages.create = fake_create
+
+        async def run():
+            with patch.object(question_service, "_LLM_SEMAPHORE", asyncio.Semaphore(2)):
+                await asyncio.gather(*(service._chat_async("s", f"u{i}") for i in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+
+
+class TestLocalRewrite:
+    """Tests for skipping the LLM on trivial first-call questions."""
+
+    @pytest.fixture
+    def enabled(self):
+        """Opt in to local formatting for questions under 10 tokens."""
+        from app.services import question_service
+        with patch.object(question_service, "LOCAL_REWRITE_MAX_TOKENS", 10):
+            yield
+
+    def test_default_goes_to_llm(self, service):
+        """Local formatting is opt-in; by default short questions still use the LLM."""
+        from app.services import question_service
+        assert question_service.LOCAL_REWRITE_MAX_TOKENS == 0
+        service.modify_question_tone("Industry?", options=["Fintech", "Health"])
+        assert service.client.messages.create.call_count == 1
+        assert service._local_rewrites == 0
+
+    def test_short_question_with_options_formatted_locally(self, service, enabled):
+        """A short first question with options should not call the API when enabled."""
+        result = service.modify_question_tone("Industry?", options=["Fintech", "Health"])
+
+        assert result == "Industry?\n\n- Fintech\n- Health"
+        service.client.messages.create.assert_not_called()
+        assert service._local_rewrites == 1
+
+    def test_conversation_turn_goes_to_llm(self, service, enabled):
+        """Questions with a user message still need the LLM to acknowledge."""
+        service.modify_question_tone("Industry?", user_message="Hi", options=["Fintech"])
+        assert service.client.messages.create.call_count == 1
+
+    def test_short_question_without_options_goes_to_llm(self, service, enabled):
+        """Without options there is nothing to format locally."""
+        service.modify_question_tone("Industry?")
+        assert service.client.messages.create.call_count == 1
+
+    def test_disabled_by_zero_threshold(self, service):
+        """QUESTION_LOCAL_REWRITE_MAX_TOKENS=0 should always call the LLM."""
+        from app.services import question_service
+        with patch.object(question_service, "LOCAL_REWRITE_MAX_TOKENS", 0):
+            service.modify_question_tone("Industry?", options=["Fintech"])
+        assert service.client.messages.create.call_count == 1
+
+
+class TestUsageMetrics:
+    """Tests for per-call token/latency instrumentation."""
+
+    def test_usage_totals_accumulate(self, service):
+        """Token counts from each response should be added to the totals."""
+        response = _fake_response("Q?")
+        response.usage = Mock(input_tokens=120, output_tokens=8)
+        service.client.messages.create.return_value = response
+
+        service._chat("system", "one")
+        service._chat("system", "two")
+        stats = service.get_usage_stats()
+
+        assert stats["calls"] == 2
+        assert stats["input_tokens"] == 240
+        assert stats["output_tokens"] == 16
+        assert stats["fallbacks"] == 0
+
+    def test_fallback_counted(self, service):
+        """A failed Anthropic call routed to the fallback should be counted."""
+        service.client.messages.create.side_effect = ValueError("down")
+        with patch('app.services.llm_fallback.fallback_from_anthropic_error', return_value="Q?"):
+            assert service._chat("system", "user") == "Q?"
+        assert service.get_usage_stats()["fallbacks"] == 1
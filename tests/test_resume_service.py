@@ -0,0 +1,433 @@
+"""
+Unit tests for ResumeService.
+Tests text extraction helpers and input validation.
+"""
+import pytest
+import logging
+from unittest.mock import Mock, MagicMock, patch
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _fake_fitz(pages):
+    """Build a stand-in PyMuPDF module whose documents yield the given page texts."""
+    doc = MagicMock()
+    doc.__enter__.return_value = doc
+    doc.__iter__.side_effect = lambda: iter([Mock(get_text=Mock(return_value=p)) for p in pages])
+    module = Mock()
+    module.open.return_value = doc
+    return module
+
+
+class TestExtractText:
+    """Tests for in-memory text extraction."""
+
+    def test_uses_pymupdf_when_available(self):
+        """Pages should be joined with blank lines and tagged PyMuPDF."""
+        from app.services import resume_service
+        fitz = _fake_fitz(["Page one", "Page two"])
+        with patch.object(resume_service, 'fitz', fitz):
+            text, method = resume_service._extract_text(b"%PDF-1.7", ".pdf")
+
+        assert text == "Page one\n\nPage two"
+        assert method == "PyMuPDF"
+        fitz.open.assert_called_once_with(stream=b"%PDF-1.7", filetype="pdf")
+
+    def test_long_pdf_uses_one_document(self):
+        """Long PDFs should be read from a single document in page order."""
+        from app.services import resume_service
+        pages = [f"Page {i}" for i in range(7)]
+        fitz = _fake_fitz(pages)
+        with patch.object(resume_service, 'fitz', fitz):
+            text, method = resume_service._extract_text(b"%PDF-1.7", ".pdf")
+
+        assert text == "\n\n".join(pages)
+        fitz.open.assert_called_once()
+
+    def test_falls_back_to_pypdf(self):
+        """A PyMuPDF failure should fall back to pypdf."""
+        from app.services import resume_service
+        fitz = Mock()
+        fitz.open.side_effect = RuntimeError("broken xref")
+        reader = Mock()
+        reader.return_value.pages = [Mock(extract_text=Mock(return_value="Recovered"))]
+
+        with patch.object(resume_service, 'fitz', fitz), \
+             patch('pypdf.PdfReader', reader):
+            text, method = resume_service._extract_text(b"%PDF-1.7", ".pdf")
+
+        assert text == "Recovered"
+        assert method == "pypdf"
+
+    def test_missing_pymupdf_uses_pypdf_quietly(self, caplog):
+        """Without PyMuPDF installed, pypdf should be used without a warning."""
+        from app.services import resume_service
+        reader = Mock()
+        reader.return_value.pages = [Mock(extract_text=Mock(return_value="Plain"))]
+
+        with patch.object(resume_service, 'fitz', None), \
+             patch('pypdf.PdfReader', reader), \
+             caplog.at_level(logging.WARNING, logger=resume_service.__name__):
+            text, method = resume_service._extract_text(b"%PDF-1.7", ".pdf")
+
+        assert (text, method) == ("Plain", "pypdf")
+        assert not caplog.records
+
+    def test_docx_read_from_memory(self):
+        """DOCX bytes should be handed to docx2txt as a stream."""
+        from app.services import resume_service
+        with patch('docx2txt.process', return_value="Docx text") as process:
+            text, method = resume_service._extract_text(b"PK...", ".docx")
+
+        assert (text, method) == ("Docx text", "docx2txt")
+        assert process.call_args[0][0].read() == b"PK..."
+
+    def test_txt_decoded_leniently(self):
+        """Plain text should be decoded without failing on bad bytes."""
+        from app.services import resume_service
+        text, method = resume_service._extract_text(b"Jane Doe\n\xffEngineer", ".txt")
+
+        assert text == "Jane Doe\n\ufffdEngineer"
+        assert method == "text"
+
+    def test_unsupported_type_raises(self):
+        """Unknown suffixes should raise ValueError."""
+        from app.services import resume_service
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            resume_service._extract_text(b"...", ".doc")
+
+
+class TestBase64ResumeHash:
+    """Tests for skipping re-extraction of identical uploads."""
+
+    def _resume_data(self, raw=b"Jane Doe\nEngineer"):
+        import base64
+        return {"content": base64.b64encode(raw).decode(), "filename": "cv.txt", "content_type": "text/plain"}
+
+    def test_unchanged_upload_skips_extraction(self):
+        """A re-upload matching the cached hash should not be re-parsed."""
+        import hashlib
+        from app.services import resume_service
+        profile = Mock(resume_text="Jane Doe\nEngineer", processing_status='completed')
+        cache = Mock()
+        cache.get_resume_hash.return_value = resume_service._resume_fingerprint(
+            hashlib.sha256(b"Jane Doe\nEngineer").hexdigest(), "Jane Doe\nEngineer"
+        )
+
+        with patch.object(resume_service.UserProfile, 'get', return_value=profile), \
+             patch('app.utils.cache.cache', cache), \
+             patch.object(resume_service, '_extract_text') as extract:
+            result = resume_service.ResumeService()._process_base64_resume("u1", self._resume_data())
+
+        assert result["success"] and result["skipped"]
+        assert result["reason"] == "unchanged"
+        extract.assert_not_called()
+        profile.save.assert_not_called()
+
+    def test_changed_upload_extracts_and_records_hash(self):
+        """New content should be parsed and its hash stored."""
+        import hashlib
+        from app.services import resume_service
+        profile = Mock(resume_text="Old text", processing_status='completed', resume_text_data=None)
+        cache = Mock()
+        cache.get_resume_hash.return_value = "stale"
+
+        with patch.object(resume_service.UserProfile, 'get', return_value=profile), \
+             patch.object(resume_service.UserProfile, 'update_processing_status') as update_status, \
+             patch('app.utils.cache.cache', cache):
+            result = resume_service.ResumeService()._process_base64_resume("u1", self._resume_data())
+
+        assert result["success"] and not result["skipped"]
+        assert profile.resume_text == "Jane Doe\nEngineer"
+        # Interim status is a column update; the full row is written once
+        update_status.assert_called_once_with("u1", 'processing')
+        profile.save.assert_called_once()
+        cache.set_resume_hash.assert_called_once_with(
+            "u1", resume_service._resume_fingerprint(
+                hashlib.sha256(b"Jane Doe\nEngineer").hexdigest(), "Jane Doe\nEngineer"
+            )
+        )
+
+    def test_text_replaced_elsewhere_is_reextracted(self):
+        """Re-uploading A after resume_text was replaced (e.g. via URL) must not skip."""
+        import hashlib
+        from app.services import resume_service
+        # Hash recorded for upload A, but the profile now holds B's text
+        profile = Mock(resume_text="Text from B", processing_status='completed', resume_text_data=None)
+        cache = Mock()
+        cache.get_resume_hash.return_value = resume_service._resume_fingerprint(
+            hashlib.sha256(b"Jane Doe\nEngineer").hexdigest(), "Jane Doe\nEngineer"
+        )
+
+        with patch.object(resume_service.UserProfile, 'get', return_value=profile), \
+             patch.object(resume_service.UserProfile, 'update_processing_status'), \
+             patch('app.utils.cache.cache', cache):
+            result = resume_service.ResumeService()._process_base64_resume("u1", self._resume_data())
+
+        assert result["success"] and not result["skipped"]
+        assert profile.resume_text == "Jane Doe\nEngineer"
+
+
+class TestCleanupText:
+    """Tests for extracted-text whitespace normalization."""
+
+    def test_strips_lines_and_drops_blank_lines(self):
+        """Lines should be trimmed and blank runs removed."""
+        from app.services.resume_service import ResumeService
+        raw = "  Jane Doe \r\n\n \t \n  Senior Engineer\t\x0c\n  Python,  Go  \n\n"
+        assert ResumeService()._cleanup_text(raw) == "Jane Doe\nSenior Engineer\nPython,  Go"
+
+    def test_empty_input(self):
+        """Empty or whitespace-only text should clean to an empty string."""
+        from app.services.resume_service import ResumeService
+        assert ResumeService()._cleanup_text("") == ""
+        assert ResumeService()._cleanup_text(" \n\t\n ") == ""
+
+
+class TestBase64Decoding:
+    """Tests for base64 payload handling."""
+
+    def test_non_ascii_content_rejected_as_invalid_encoding(self):
+        """Non-ASCII payloads should report invalid encoding, not a parse failure."""
+        from app.services import resume_service
+        with patch.object(resume_service.UserProfile, 'get') as get:
+            result = resume_service.ResumeService()._process_base64_resume(
+                "u1", {"content": "SmFuZQ==\u00e9", "filename": "cv.txt"}
+            )
+
+        assert result["reason"] == "Invalid encoding"
+        get.assert_not_called()
+
+    def test_oversized_payload_rejected_before_decoding(self):
+        """Payloads longer than the encoded limit should never be decoded."""
+        from app.services import resume_service
+        payload = "A" * (resume_service.MAX_RESUME_BASE64_CHARS + 4)
+        with patch.object(resume_service.base64, 'b64decode') as decode:
+            result = resume_service.ResumeService()._process_base64_resume("u1", {"content": payload})
+
+        assert result["reason"] == "File too large"
+        decode.assert_not_called()
+
+    def test_line_wrapped_payload_at_limit_accepted(self):
+        """MIME line breaks shouldn't count toward the encoded size limit."""
+        import base64
+        from app.services import resume_service
+        raw = b"x" * 3000
+        wrapped = base64.encodebytes(raw).decode()
+        with patch.object(resume_service, 'MAX_RESUME_SIZE_BYTES', 3000), \
+             patch.object(resume_service, 'MAX_RESUME_BASE64_CHARS', 4004), \
+             patch.object(resume_service.UserProfile, 'get', side_effect=resume_service.UserProfile.DoesNotExist):
+            result = resume_service.ResumeService()._process_base64_resume("u1", {"content": wrapped})
+
+        assert len(wrapped) > 4004
+        assert result["reason"] == "User profile not found"
+
+
+class TestMultistreamDownload:
+    """Tests for parallel Range-request downloads."""
+
+    @staticmethod
+    def _ranged_get(body):
+        """Fake session.get that serves byte ranges of body."""
+        def get(url, headers=None, **kwargs):
+            start, end = map(int, headers["Range"].split("=")[1].split("-"))
+            response = MagicMock(status_code=206)
+            response.__enter__.return_value = response
+            response.iter_content.return_value = [body[start:end + 1]]
+            return response
+        return get
+
+    def test_chunks_reassembled_in_order(self):
+        """Range responses should be joined back into the original bytes."""
+        from app.services import resume_service
+        body = bytes(range(256)) * 40
+        head = Mock(status_code=200, headers={'Accept-Ranges': 'bytes', 'Content-Length': str(len(body))})
+
+        with patch.object(resume_service, 'RESUME_MULTISTREAM_MIN_BYTES', 1), \
+             patch.object(resume_service._SESSION, 'head', return_value=head), \
+             patch.object(resume_service._SESSION, 'get', side_effect=self._ranged_get(body)) as get:
+            content = resume_service.ResumeService()._download_multistream("https://cdn/cv.pdf", nchunks=4)
+
+        assert content == body
+        assert get.call_count == 4
+
+    def test_no_range_support_falls_back(self):
+        """Servers without Accept-Ranges should use the single-stream path."""
+        from app.services import resume_service
+        head = Mock(status_code=200, headers={'Content-Length': '5000000'})
+
+        with patch.object(resume_service._SESSION, 'head', return_value=head), \
+             patch.object(resume_service._SESSION, 'get') as get:
+            assert resume_service.ResumeService()._download_multistream("https://cdn/cv.pdf", nchunks=4) is None
+        get.assert_not_called()
+
+    def test_ignored_range_header_falls_back(self):
+        """A 200 reply to a Range request should abandon the parallel download."""
+        from app.services import resume_service
+        head = Mock(status_code=200, headers={'Accept-Ranges': 'bytes', 'Content-Length': '4000'})
+        full = MagicMock(status_code=200)
+        full.__enter__.return_value = full
+
+        with patch.object(resume_service, 'RESUME_MULTISTREAM_MIN_BYTES', 1), \
+             patch.object(resume_service._SESSION, 'head', return_value=head), \
+             patch.object(resume_service._SESSION, 'get', return_value=full):
+            assert resume_service.ResumeService()._download_multistream("https://cdn/cv.pdf", nchunks=4) is None
+        full.iter_content.assert_not_called()
+
+    def test_oversized_content_length_rejected(self):
+        """A HEAD Content-Length over the limit should raise before downloading."""
+        from app.services import resume_service
+        head = Mock(status_code=200, headers={
+            'Accept-Ranges': 'bytes', 'Content-Length': str(resume_service.MAX_RESUME_SIZE_BYTES + 1)
+        })
+        with patch.object(resume_service._SESSION, 'head', return_value=head):
+            with pytest.raises(ValueError, match="too large"):
+                resume_service.ResumeService()._download_multistream("https://cdn/cv.pdf", nchunks=4)
+
+
+    def test_single_stream_by_default(self):
+        """With the default stream count no HEAD probe should be sent."""
+        from app.services import resume_service
+        with patch.object(resume_service._SESSION, 'head') as head:
+            assert resume_service.ResumeService()._download_multistream("https://cdn/cv.pdf") is None
+        head.assert_not_called()
+
+    def test_proxied_download_skips_multistream(self):
+        """Downloads through the backend proxy should never be probed for ranges."""
+        from app.services import resume_service
+        response = Mock(headers={})
+        response.iter_content.return_value = [b"cv"]
+        with patch.object(resume_service.ResumeService, '_download_multistream') as multistream, \
+             patch.object(resume_service._SESSION, 'get', return_value=response):
+            content = resume_service.ResumeService()._download_with_size_limit(
+                "https://backend/stream-file?url=x", multistream=False
+            )
+
+        assert content == b"cv"
+        multistream.assert_not_called()
+
+
+class TestStreamingDownload:
+    """Tests for the single-stream download path."""
+
+    def _response(self, chunks, headers=None):
+        response = Mock(headers=headers or {})
+        response.iter_content.return_value = chunks
+        return response
+
+    def test_chunks_concatenated(self):
+        """Streamed chunks should be returned as one bytes object."""
+        from app.services import resume_service
+        response = self._response([b"abc", b"def"])
+        with patch.object(resume_service.ResumeService, '_download_multistream', return_value=None), \
+             patch.object(resume_service._SESSION, 'get', return_value=response):
+            content = resume_service.ResumeService()._download_with_size_limit("https://cdn/cv.txt")
+
+        assert content == b"abcdef"
+        assert isinstance(content, bytes)
+
+    def test_size_limit_enforced_while_streaming(self):
+        """Bodies over the limit without a Content-Length should still be cut off."""
+        from app.services import resume_service
+        response = self._response([b"x" * 600, b"x" * 600])
+        with patch.object(resume_service, 'MAX_RESUME_SIZE_BYTES', 1000), \
+             patch.object(resume_service.ResumeService, '_download_multistream', return_value=None), \
+             patch.object(resume_service._SESSION, 'get', return_value=response):
+            with pytest.raises(ValueError, match="size limit"):
+                resume_service.ResumeService()._download_with_size_limit("https://cdn/cv.txt")
+
+
+class TestUrlAllowlist:
+    """Tests for the SSRF domain allowlist."""
+
+    def test_allowlisted_domain_with_port(self):
+        """Ports should be ignored when matching the allowlist."""
+        from app.services import resume_service
+        with patch.object(resume_service, 'ALLOWED_RESUME_DOMAINS', frozenset({'cdn.example.com'})):
+            service = resume_service.ResumeService()
+            assert service._is_url_allowed("https://CDN.example.com:8443/cv.pdf?sig=1")
+            assert not service._is_url_allowed("https://evil.example.com/cv.pdf")
+
+    def test_userinfo_cannot_spoof_allowlisted_host(self):
+        """Credentials before '@' must not be mistaken for the host."""
+        from app.services import resume_service
+        with patch.object(resume_service, 'ALLOWED_RESUME_DOMAINS', frozenset({'cdn.example.com'})):
+            service = resume_service.ResumeService()
+            assert not service._is_url_allowed("https://cdn.example.com:x@evil.example.net/cv.pdf")
+            assert not service._is_url_allowed("https://cdn.example.com@evil.example.net/cv.pdf")
+
+    def test_ipv6_host(self):
+        """Bracketed IPv6 hosts should match without brackets or port."""
+        from app.services import resume_service
+        with patch.object(resume_service, 'ALLOWED_RESUME_DOMAINS', frozenset({'::1'})):
+            assert resume_service.ResumeService()._is_url_allowed("http://[::1]:8080/cv.pdf")
+
+    def test_no_allowlist_outside_local_mode(self):
+        """Without an allowlist, direct downloads are only allowed in local mode."""
+        from app.services import resume_service
+        with patch.object(resume_service, 'ALLOWED_RESUME_DOMAINS', frozenset()):
+            service = resume_service.ResumeService()
+            with patch.object(resume_service, 'LOCAL_MODE', False):
+                assert not service._is_url_allowed("https://cdn.example.com/cv.pdf")
+            with patch.object(resume_service, 'LOCAL_MODE', True):
+                assert service._is_url_allowed("https://cdn.example.com/cv.pdf")
+
+
+class TestFailureStatus:
+    """Tests for recording failure statuses."""
+
+    def test_parse_failure_uses_single_update(self):
+        """A parse failure should update the status without re-reading the profile."""
+        import base64
+        from app.services import resume_service
+        profile = Mock(resume_text="", processing_status='pending')
+        data = {"content": base64.b64encode(b"data").decode(), "filename": "cv.rtf", "content_type": "text/rtf"}
+
+        with patch.object(resume_service.UserProfile, 'get', return_value=profile) as get, \
+             patch.object(resume_service.UserProfile, 'update_processing_status') as update_status, \
+             patch('app.utils.cache.cache', Mock(get_resume_hash=Mock(return_value=None))):
+            result = resume_service.ResumeService()._process_base64_resume("u1", data)
+
+        assert result["reason"] == "Parsing failed"
+        assert get.call_count == 1
+        update_status.assert_called_with("u1", 'failed_parsing')
+        profile.save.assert_not_called()
+
+
+class TestStoreResumeText:
+    """Tests for setting extracted text on a profile."""
+
+    def test_flat_and_nested_fields_agree(self):
+        """The nested data and flat columns should carry the same values."""
+        from app.adapters.supabase_profiles import UserProfile
+        from app.services.resume_service import ResumeService
+        profile = UserProfile(user_id="u1", resume_text="old")
+
+        ResumeService()._store_resume_text(profile, "New text", "PyMuPDF")
+        profile._sync_from_nested_objects()
+
+        assert profile.resume_text == profile.resume_text_data.text == "New text"
+        assert profile.resume_extraction_method == "PyMuPDF"
+        assert profile.resume_extracted_at is profile.resume_text_data.extracted_at
+
+
+class TestResolveSuffix:
+    """Tests for upload file-type detection."""
+
+    @pytest.mark.parametrize("filename,content_type,expected", [
+        ("cv.bin", "application/pdf", ".pdf"),
+        ("cv", "application/vnd.openxmlformats-officedocument.wordprocessingml.document", ".docx"),
+        ("cv.txt", "text/plain; charset=utf-8", ".txt"),
+        ("cv.DOCX", "application/octet-stream", ".docx"),
+        ("resume", "application/octet-stream", ".pdf"),
+        ("cv.doc", "application/msword", ".docx"),
+        ("cv", "application/pdf; charset=binary", ".pdf"),
+        ("cv.docx", "text/plain", ".docx"),
+    ])
+    def test_suffix_resolution(self, filename, content_type, expected):
+        """A PDF/Word MIME type wins, then the filename extension, then PDF."""
+        from app.services.resume_service import _resolve_suffix
+        assert _resolve_suffix(filename, content_type) == expected
@@ -63,7 +63,7 @@ class TestQuestionRouter:
             'ENVIRONMENT': 'test',
             'RATE_LIMIT_ENABLED': 'false',
         }):
-            with patch('app.services.question_service.OpenAI'):
+            with patch('app.services.question_service.Anthropic'):
                 app = get_fresh_app()
                 return TestClient(app)
 
@@ -72,9 +72,11 @@ class TestQuestionRouter:
         """Mock the question service."""
         with patch('app.routers.question.get_question_service') as mock:
             service = Mock()
-            service.modify_question_tone.return_value = "Modified question"
-            service.generate_followup_question.return_value = "Follow up chip"
+            service.modify_question_tone_async = AsyncMock(return_value="Modified question")
+            service.generate_followup_question_async = AsyncMock(return_value="Follow up chip")
             service.build_conversation_context.return_value = "context"
+            service.summarize_history_async = AsyncMock(return_value=None)
+            service.cached_history_summary.return_value = None
             mock.return_value = service
             yield service
 
@@ -90,9 +92,11 @@ class TestQuestionRouter:
 
         # Create mock service
         mock_service = Mock()
-        mock_service.modify_question_tone.return_value = "Modified question"
-        mock_service.generate_followup_question.return_value = "Follow up chip"
+        mock_service.modify_question_tone_async = AsyncMock(return_value="Modified question")
+        mock_service.generate_followup_question_async = AsyncMock(return_value="Follow up chip")
         mock_service.build_conversation_context.return_value = "context"
+        mock_service.summarize_history_async = AsyncMock(return_value=None)
+        mock_service.cached_history_summary.return_value = None
 
         with patch.dict(os.environ, {
             'OPENAI_API_KEY': 'test-key',
@@ -105,7 +109,7 @@ class TestQuestionRouter:
             'ENVIRONMENT': 'test',
             'RATE_LIMIT_ENABLED': 'false',
         }):
-            with patch('app.services.question_service.OpenAI'):
+            with patch('app.services.question_service.Anthropic'):
                 app = get_fresh_app()
                 from app.routers.question import get_question_service
 
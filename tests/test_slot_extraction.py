@@ -0,0 +1,307 @@
+"""
+Unit tests for SlotExtractor and SlotSchema.
+Tests rule-based slot extraction and objective-aware slot selection.
+"""
+import pytest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.slot_extraction import SlotExtractor, SlotSchema, SlotStatus
+
+
+@pytest.fixture
+def extractor():
+    """Create a SlotExtractor."""
+    return SlotExtractor()
+
+
+class TestUserTypeRoleSignals:
+    """Tests for founder vs investor disambiguation."""
+
+    def test_founder_seeking_investors_not_classified_as_investor(self, extractor):
+        """Founders looking for investors should not match investor options."""
+        results = extractor.extract_from_text(
+            "I'm not an investor, I'm a founder looking for US investors",
+            target_slots=["user_type"]
+        )
+        assert "investor" not in results["user_type"].value.lower()
+
+    def test_investor_detected(self, extractor):
+        """Investors describing themselves should match an investor option."""
+        results = extractor.extract_from_text(
+            "I am an angel investor looking to invest in early-stage startups",
+            target_slots=["user_type"]
+        )
+        assert results["user_type"].value == "Angel Investor"
+        assert results["user_type"].status == SlotStatus.FILLED
+
+    def test_dual_role_lowers_confidence(self, extractor):
+        """An explicit 'both' with two roles should drop confidence to ask for the primary one."""
+        results = extractor.extract_from_text(
+            "I'm both an angel investor and an advisor", target_slots=["user_type"]
+        )
+        assert results["user_type"].confidence == 0.45
+
+    def test_dual_role_indicator_needs_whole_word(self, extractor):
+        """'surplus' should not count as the 'plus' dual-role indicator."""
+        results = extractor.extract_from_text(
+            "Angel investor and advisor with a cash surplus", target_slots=["user_type"]
+        )
+        assert results["user_type"].confidence > 0.45
+
+    def test_user_is_founder_signal(self):
+        """Founder indicators, seeking-investor phrasing and negations should be detected."""
+        from app.services.slot_extraction import _user_is_founder
+        assert _user_is_founder("i'm a founder raising a seed round")
+        assert not _user_is_founder("i am an angel investor")
+        assert _user_is_founder("we plan to fundraise next year")
+        assert _user_is_founder("i'm not an investor")
+
+
+class TestKeywordHits:
+    """Tests for the per-message keyword scan."""
+
+    def test_hits_are_schema_keywords_in_text(self):
+        """Only schema keywords that occur in the text should be reported."""
+        from app.services.slot_extraction import _keyword_hits
+        hits = _keyword_hits("we need a mentor and funding")
+        assert {"mentor", "funding", "need"} <= hits
+        assert "hiring" not in hits
+
+    def test_free_text_slot_uses_keywords(self, extractor):
+        """Free-text slots should fill only when one of their keywords appears."""
+        results = extractor.extract_from_text(
+            "I'm looking for introductions to seed investors in Europe",
+            target_slots=["requirements"]
+        )
+        assert results["requirements"].value.startswith("I'm looking for")
+        assert extractor.extract_from_text("Hello there, nice to meet you all", target_slots=["requirements"]) == {}
+
+    def test_non_schema_slot_keywords(self, extractor):
+        """Keywords of a slot defined outside SlotSchema should still be found."""
+        from datetime import datetime
+        from app.services.slot_extraction import SlotDefinition, SlotType, _slot_keyword_hits
+        slot_def = SlotDefinition(
+            name="favourite_animal", display_name="Favourite Animal",
+            slot_type=SlotType.FREE_TEXT, description="Custom slot",
+            extract_keywords=["zebra", "mentor"]
+        )
+        text = "A zebra would be my pick, no question about it"
+        assert _slot_keyword_hits(text.lower(), slot_def) == {"zebra"}
+        result = extractor._extract_slot(text, text.lower(), slot_def, datetime.utcnow())
+        assert result is not None and result.value == text
+
+
+class TestSlotSchemaLookup:
+    """Tests for the cached slot list and name index."""
+
+    def test_get_all_slots_is_cached(self):
+        """Repeated calls should return the same immutable tuple."""
+        assert SlotSchema.get_all_slots() is SlotSchema.get_all_slots()
+        assert isinstance(SlotSchema.get_all_slots(), tuple)
+
+    def test_get_slot_by_name_returns_first_definition(self):
+        """Duplicate names should resolve to the first definition, as the linear scan did."""
+        first = next(s for s in SlotSchema.get_all_slots() if s.name == "stage_preference")
+        assert SlotSchema.get_slot_by_name("stage_preference") is first
+        assert SlotSchema.get_slot_by_name("no_such_slot") is None
+
+
+class TestPartitionSlots:
+    """Tests for the cached independent/dependent slot split."""
+
+    def test_partition_respects_targets_and_dependencies(self):
+        """Targeted slots should be split by whether they declare dependencies."""
+        from app.services.slot_extraction import _partition_slots
+        independent, dependent = _partition_slots(frozenset({"user_type", "check_size"}))
+        assert [s.name for s in independent] == ["user_type"]
+        assert [s.name for s in dependent] == ["check_size"]
+
+    def test_partition_without_targets_covers_all_slots(self):
+        """No targets should partition the full schema."""
+        from app.services.slot_extraction import _partition_slots
+        independent, dependent = _partition_slots(None)
+        assert len(independent) + len(dependent) == len(SlotSchema.get_all_slots())
+
+
+class TestSlotDispatch:
+    """Tests for the slot_type -> extractor table."""
+
+    def test_every_slot_type_has_a_handler(self, extractor):
+        """Each SlotType used by the schema should dispatch to an extractor."""
+        used_types = {s.slot_type for s in SlotSchema.get_all_slots()}
+        assert used_types <= set(extractor._dispatch)
+
+
+class TestOptionMatching:
+    """Tests for select-option matching on precomputed option data."""
+
+    def test_options_are_lowercased_and_split_once(self):
+        """SlotDefinition should derive lowercased options and their words."""
+        slot = SlotSchema.get_slot_by_name("user_type")
+        assert slot._options_lower == tuple(o.lower() for o in slot.options)
+        founder_idx = slot._options_lower.index("founder/entrepreneur")
+        assert slot._option_words[founder_idx] == ("founder", "entrepreneur")
+
+    def test_keyword_scores_precomputed_per_option(self):
+        """Direct keyword hits should score 0.75 and associations 0.65, in keyword order."""
+        from app.services.slot_extraction import _keyword_option_score
+        assert _keyword_option_score("invest", "angel investor") == 0.75
+        assert _keyword_option_score("mentor", "advisor/consultant") == 0.65
+        assert _keyword_option_score("mentor", "vc partner") == 0.0
+        slot = SlotSchema.get_slot_by_name("user_type")
+        for option, scores in zip(slot._options_lower, slot._option_keyword_scores):
+            assert [kw for kw, _ in scores] == [
+                kw for kw in slot.extract_keywords if _keyword_option_score(kw, option)
+            ]
+
+    def test_search_word_matches_word_boundary_regex(self):
+        """The token-set shortcut should agree with the \\b regex, including punctuated words."""
+        from app.services.slot_extraction import _search_word
+        text = "we're a b2b saas co-founder team in ai/ml"
+        assert _search_word(text, "saas").span() == (12, 16)
+        assert _search_word(text, "co-founder") is not None
+        assert _search_word(text, "ai/ml") is not None
+        assert _search_word(text, "founder") is not None
+        assert _search_word(text, "fin") is None
+        assert _search_word(text, "saas co-founder") is not None
+        assert _search_word(text, "clean tech") is None
+
+    def test_option_vocab_collects_option_word_runs(self):
+        """A slot's vocabulary should hold every word run of its options."""
+        slot = SlotSchema.get_slot_by_name("industry_focus")
+        assert {"fintech", "clean", "tech", "e", "commerce"} <= slot._option_vocab
+
+    def test_multi_select_skips_unrelated_text(self, extractor):
+        """Text sharing no word with the options should not fill a multi-select slot."""
+        assert extractor.extract_from_text("hello there", target_slots=["industry_focus"]) == {}
+
+    def test_multi_select_avoids_overlapping_matches(self, extractor):
+        """'Fintech' should match without 'tech' also pulling in 'Clean Tech'."""
+        results = extractor.extract_from_text(
+            "We are a fintech and saas company",
+            target_slots=["industry_focus"]
+        )
+        values = results["industry_focus"].value
+        assert "Fintech" in values and "SaaS" in values
+        assert "Clean Tech" not in values
+
+
+class TestDataclassSlots:
+    """Tests for the __slots__-based slot dataclasses."""
+
+    def test_extracted_slot_has_no_instance_dict(self):
+        """ExtractedSlot should use __slots__ and still serialize with asdict."""
+        from dataclasses import asdict
+        from app.services.slot_extraction import ExtractedSlot
+        slot = ExtractedSlot(
+            name="geography", value="UK", confidence=0.9,
+            status=SlotStatus.FILLED, source_text="based in the UK"
+        )
+        assert not hasattr(slot, "__dict__")
+        assert asdict(slot)["value"] == "UK"
+
+
+class TestDependentSlots:
+    """Tests for two-pass extraction of slots with dependencies."""
+
+    TEXT = "I am an angel investor writing checks of $50k to $100k"
+
+    def test_dependency_filled_in_same_message(self, extractor):
+        """A dependent slot should use a dependency extracted from the same text."""
+        results = extractor.extract_from_text(self.TEXT, target_slots=["user_type", "check_size"])
+        assert set(results) == {"user_type", "check_size"}
+
+    def test_dependency_from_context(self, extractor):
+        """A dependent slot should be extracted only once its dependency is known."""
+        assert extractor.extract_from_text(self.TEXT, target_slots=["check_size"]) == {}
+        results = extractor.extract_from_text(
+            self.TEXT, target_slots=["check_size"], context={"user_type": "Angel Investor"}
+        )
+        assert "check_size" in results
+
+
+class TestExtractionTimestamp:
+    """Tests for the per-message extraction timestamp."""
+
+    def test_slots_from_one_message_share_timestamp(self, extractor):
+        """All slots extracted from one message should carry the same extracted_at."""
+        results = extractor.extract_from_text(
+            "I'm the founder of a fintech startup in London raising a seed round"
+        )
+        assert len(results) > 1
+        assert len({slot.extracted_at for slot in results.values()}) == 1
+
+
+class TestNumericExtraction:
+    """Tests for number and range extraction with precompiled patterns."""
+
+    CONTEXT = {"user_type": "Angel Investor"}
+
+    def test_range_with_unit_on_second_number(self, extractor):
+        """'$5-10M' should apply the million multiplier to both ends."""
+        results = extractor.extract_from_text(
+            "around $5-10M", target_slots=["check_size"], context=self.CONTEXT
+        )
+        assert results["check_size"].value == {"min": 5_000_000.0, "max": 10_000_000.0}
+
+    def test_range_without_units_needs_clarification(self, extractor):
+        """A bare range should be extracted with low confidence."""
+        results = extractor.extract_from_text(
+            "between 1 and 5", target_slots=["check_size"], context=self.CONTEXT
+        )
+        assert results["check_size"].value == {"min": 1.0, "max": 5.0}
+        assert results["check_size"].status == SlotStatus.PARTIAL
+
+    def test_unit_counts_are_not_scaled(self, extractor):
+        """'10 years' / '50 employees' should not pick up the million multiplier."""
+        results = extractor.extract_from_text(
+            "I have 10 years of experience", target_slots=["experience_years"]
+        )
+        assert results["experience_years"].value == 10.0
+        results = extractor.extract_from_text(
+            "we have 50 employees", target_slots=["team_size"], context=self.CONTEXT
+        )
+        assert results["team_size"].value == 50.0
+
+    def test_thousands_separators(self, extractor):
+        """'$50,000' should parse as 50000.0."""
+        from app.services.slot_extraction import _parse_number
+        assert _parse_number("50,000") == 50000.0
+        assert _parse_number("2.5") == 2.5
+
+    def test_suffix_multipliers(self, extractor):
+        """k/m suffixes should scale the number they follow."""
+        results = extractor.extract_from_text(
+            "we raised 3m", target_slots=["team_size"], context=self.CONTEXT
+        )
+        assert results["team_size"].value == 3_000_000.0
+
+
+class TestBooleanExtraction:
+    """Tests for yes/no extraction."""
+
+    @pytest.fixture
+    def bool_slot(self):
+        from app.services.slot_extraction import SlotDefinition, SlotType
+        return SlotDefinition(
+            name="open_to_remote", display_name="Open to remote",
+            slot_type=SlotType.BOOLEAN, description="Open to remote work?"
+        )
+
+    def _extract(self, extractor, bool_slot, text):
+        from datetime import datetime
+        return extractor._extract_boolean(text, text.lower(), bool_slot, datetime.utcnow())
+
+    def test_yes_and_no(self, extractor, bool_slot):
+        """Whole-word answers should map to True/False."""
+        assert self._extract(extractor, bool_slot, "Yes, definitely").value is True
+        assert self._extract(extractor, bool_slot, "No, I don't").value is False
+
+    def test_substrings_do_not_count(self, extractor, bool_slot):
+        """Words merely containing an answer ('know', 'notion', 'yesterday') should not match."""
+        assert self._extract(extractor, bool_slot, "I know the north team from notion yesterday") is None
+
@@ -0,0 +1,151 @@
+"""
+Unit tests for SmartEdit and DependencyGraph.
+Tests dependency traversal, impact analysis and edit history.
+"""
+import pytest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.slot_extraction import ExtractedSlot, SlotStatus
+from app.services.smart_edit import DependencyGraph, SmartEdit
+
+
+@pytest.fixture
+def graph():
+    """Create a DependencyGraph."""
+    return DependencyGraph()
+
+
+@pytest.fixture
+def editor():
+    """Create a SmartEdit backed by an in-memory context manager."""
+    return SmartEdit()
+
+
+@pytest.fixture
+def session(editor):
+    """Create a session with user_type, check_size and geography filled."""
+    context = editor.context_manager.create_session("user-1")
+    filled = [
+        ("user_type", "Angel Investor"),
+        ("check_size", {"min": 1, "max": 2}),
+        ("geography", "UK"),
+    ]
+    for name, value in filled:
+        context.slots[name] = ExtractedSlot(
+            name=name, value=value, confidence=0.9,
+            status=SlotStatus.FILLED, source_text=str(value)
+        )
+    return context
+
+
+class TestDependencyTraversal:
+    """Tests for precomputed dependent/dependency lookups."""
+
+    def test_user_type_dependents(self, graph):
+        """Role-specific slots should depend on user_type."""
+        dependents = graph.get_dependents("user_type")
+        assert {"check_size", "stage_preference", "company_stage", "team_size"} <= dependents
+        assert graph.get_dependents("team_size") == frozenset()
+
+    def test_recursive_lookup_is_precomputed(self, graph):
+        """Recursive lookups should return the closure built with the graph."""
+        assert graph.get_dependents("user_type") is graph.get_dependents("user_type")
+        assert graph.get_dependencies("check_size") == {"user_type"}
+
+    def test_slot_defs_are_shared(self):
+        """Graph construction should reuse one memoized slot-definition dict."""
+        from app.services.smart_edit import _graph_slot_defs
+        assert _graph_slot_defs() is _graph_slot_defs()
+        assert "user_type" in _graph_slot_defs()
+
+    def test_unknown_slot(self, graph):
+        """Unknown slots should have no dependents or dependencies."""
+        assert graph.get_dependents("no_such_slot") == frozenset()
+        assert graph.get_dependencies("no_such_slot", recursive=False) == frozenset()
+
+    def test_critical_path_orders_dependencies_first(self, graph):
+        """Each slot on the critical path should follow the slots it depends on."""
+        graph._depends_on["check_size"] |= {"geography"}
+        graph._depended_by["geography"] |= {"check_size"}
+        graph._depends_on["team_size"] |= {"check_size"}
+        graph._depended_by["check_size"] |= {"team_size"}
+        graph._trans_dependencies = graph._transitive_closure(graph._depends_on)
+        path = graph.get_critical_path("team_size")
+        assert set(path) == {"user_type", "geography", "check_size"}
+        assert path.index("check_size") > path.index("user_type")
+        assert path.index("check_size") > path.index("geography")
+
+    def test_cycles_detected_at_build_time(self, graph):
+        """The schema is acyclic, so no slot should report a circular dependency."""
+        assert graph._cyclic_slots == frozenset()
+        assert not graph.has_circular_dependency("check_size")
+        assert not graph.has_circular_dependency("no_such_slot")
+
+
+class TestSharedGraph:
+    """Tests for the process-wide dependency graph."""
+
+    def test_smart_edits_share_graph(self):
+        """Every SmartEdit should reuse the same DependencyGraph."""
+        assert SmartEdit().graph is SmartEdit().graph is DependencyGraph.instance()
+
+
+class TestAnalyzeEdit:
+    """Tests for edit impact analysis."""
+
+    def test_leaf_slot_has_no_impact(self, editor, session):
+        """Editing a slot nothing depends on should short-circuit to NONE."""
+        analysis = editor.analyze_edit(session.session_id, "check_size", {"min": 5, "max": 10})
+        assert analysis.impact_level.value == "none"
+        assert analysis.affected_slots == [] and analysis.will_invalidate == []
+        assert analysis.warnings == ["'check_size' is a critical slot that affects matching."]
+
+    def test_user_type_invalidates_filled_dependents(self, editor, session):
+        """Changing user_type should invalidate its filled dependents."""
+        analysis = editor.analyze_edit(session.session_id, "user_type", "Founder/Entrepreneur")
+        assert analysis.will_invalidate == ["check_size"]
+        assert analysis.impact_level.value == "low"
+        assert set(analysis.affected_slots) == editor.graph.get_dependents("user_type")
+
+
+class TestEditableSlots:
+    """Tests for the editable slot listing."""
+
+    def test_dependent_counts_come_from_graph(self, editor, session):
+        """Each editable slot should report its precomputed transitive dependent count."""
+        editable = {e["slot_name"]: e for e in editor.get_editable_slots(session.session_id)}
+        assert editable["user_type"]["dependent_count"] == len(editor.graph.get_dependents("user_type"))
+        assert editable["check_size"]["dependent_count"] == 0
+        assert editable["user_type"]["is_critical"] is True
+
+
+class TestEditHistory:
+    """Tests for bounded per-session edit history."""
+
+    def test_history_keeps_most_recent_edits(self, editor, session):
+        """Only the last max_history_size edits should be retained, and undo should pop the newest."""
+        editor.max_history_size = 3
+        for value in ["A", "B", "C", "D", "E"]:
+            ok, _ = editor.apply_edit(session.session_id, "geography", value, force=True)
+            assert ok
+        history = editor.get_edit_history(session.session_id)
+        assert [e["new_value"] for e in history] == ["C", "D", "E"]
+
+        assert len({e["edit_id"] for e in history}) == 3
+
+        ok, result = editor.undo(session.session_id)
+        assert ok and result["restored_value"] == "D"
+        assert len(editor.get_edit_history(session.session_id)) == 2
+
+
+class TestDataclassSlots:
+    """Tests for the __slots__-based edit dataclasses."""
+
+    def test_edit_operation_has_no_instance_dict(self, editor, session):
+        """Recorded edits should use __slots__."""
+        editor.apply_edit(session.session_id, "geography", "US", force=True)
+        assert not hasattr(editor._edit_history[session.session_id][-1], "__dict__")